@@ -10,13 +10,17 @@ Version: 2.0.0
 
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
+import io
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
 
 from src.data_manager import DataManager
 from src.chart_engine import InteractiveChartEngine
 from src.plugin_manager import PluginManager
+from plugins import kernels
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -63,6 +67,10 @@ def initialize_application():
         loaded_count = sum(1 for success, _ in results.values() if success)
         logger.info(f"Loaded {loaded_count}/{len(results)} plugins")
         
+        # Compile the indicator kernels now rather than on the first render
+        if kernels.NUMBA_AVAILABLE:
+            kernels.warmup()
+        
         # Initialize ChartEngine
         chart_engine = InteractiveChartEngine(
             data_manager=data_manager,
@@ -77,7 +85,129 @@ def initialize_application():
         return None, None, None
 
 
-def render_sidebar():
+def database_version(db_path: str) -> int:
+    """
+    Get a value that changes whenever the database is written.
+    
+    market_data.py writes in WAL mode, where commits land in the -wal file
+    and the main file only changes on checkpoints, so both are checked.
+    
+    Args:
+        db_path (str): Path to the SQLite database file
+    
+    Returns:
+        int: Latest modification time of the two files, in nanoseconds
+    """
+    version = 0
+    for path in (db_path, f"{db_path}-wal"):
+        try:
+            version = max(version, os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            pass
+    return version
+
+
+@st.cache_data(ttl="5m", max_entries=64, show_spinner=False)
+def load_ohlcv(
+    _data_manager: DataManager, ticker: str, timeframe: str, data_version: int
+) -> pd.DataFrame:
+    """
+    Load and aggregate OHLCV data for a ticker.
+    
+    Cached on (ticker, timeframe, data_version) so reruns that don't change
+    any of them skip the SQL query and the aggregation. The data manager is
+    excluded from hashing.
+    """
+    return _data_manager.get_ohlcv_aggregated(ticker, timeframe)
+
+
+@st.cache_data(ttl="5m", max_entries=64, show_spinner=False)
+def load_ticker_info(_data_manager: DataManager, ticker: str, data_version: int) -> dict:
+    """Load the summary metrics for a ticker, cached per ticker and data version."""
+    return _data_manager.get_ticker_info(ticker)
+
+
+@st.cache_data(ttl="10m", show_spinner=False)
+def load_available_tickers(_data_manager: DataManager, db_path: str, data_version: int) -> list:
+    """List the tickers in the database, cached per database path and data version."""
+    return _data_manager.get_available_tickers()
+
+
+@st.cache_data(ttl="10m", show_spinner=False)
+def load_plugin_catalog(_plugin_manager: PluginManager, plugins_mtime: float) -> tuple:
+    """
+    List the loaded indicator plugins and their metadata.
+    
+    Keyed on the plugins directory mtime so the cache is invalidated when
+    plugin files are added or removed.
+    """
+    names = _plugin_manager.get_available_plugins()
+    metadata = {name: _plugin_manager.get_plugin_metadata(name) for name in names}
+    return names, metadata
+
+
+@st.cache_data(ttl="5m", max_entries=32, show_spinner=False)
+def build_chart(
+    _chart_engine: InteractiveChartEngine,
+    ticker: str,
+    timeframe: str,
+    chart_style: str,
+    width: int,
+    height: int,
+    indicators: tuple,
+    indicator_params: tuple,
+    show_volume: bool,
+    data_version: int
+) -> go.Figure:
+    """
+    Build the chart figure, cached on every setting that affects its data.
+    
+    Dimensions are part of the cache key and passed per call, so reruns with
+    unchanged settings skip trace building entirely. The theme is not: the
+    figure is drawn in the engine's current theme and recolored by the
+    caller with ``apply_theme_to_figure``, so toggling it reuses the entry.
+    ``indicator_params`` is a frozen tuple from ``freeze_indicator_params``;
+    ``data_version`` from ``database_version`` keys out figures of old data.
+    """
+    return _chart_engine.create_candlestick_chart(
+        ticker=ticker,
+        timeframe=timeframe,
+        chart_style=chart_style,
+        indicators=list(indicators) or None,
+        indicator_params={name: dict(params) for name, params in indicator_params} or None,
+        show_volume=show_volume,
+        width=width,
+        height=height
+    )
+
+
+def freeze_indicator_params(indicator_params: dict) -> tuple:
+    """Convert nested indicator parameter dicts into a hashable tuple."""
+    return tuple(
+        (name, tuple(sorted(params.items())))
+        for name, params in sorted(indicator_params.items())
+    )
+
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def export_csv(_df: pd.DataFrame, ticker: str, timeframe: str) -> bytes:
+    """Serialize the data table to CSV, cached per (ticker, timeframe)."""
+    # Write chunks straight into a byte buffer instead of building one big str
+    buffer = io.BytesIO()
+    _df.to_csv(buffer, index=True, chunksize=10000)
+    return buffer.getvalue()
+
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def export_json(_df: pd.DataFrame, ticker: str, timeframe: str) -> bytes:
+    """Serialize the data table to JSON, cached per (ticker, timeframe)."""
+    buffer = io.BytesIO()
+    # Compact records keep pandas on its fast C encoder path
+    _df.reset_index().to_json(buffer, orient='records', date_format='iso')
+    return buffer.getvalue()
+
+
+def render_sidebar(data_version):
     """Render the sidebar controls."""
     st.sidebar.title("📊 Chart Settings")
     
@@ -99,7 +229,11 @@ def render_sidebar():
     st.sidebar.subheader("Data Source")
     
     if st.session_state.data_manager:
-        available_tickers = st.session_state.data_manager.get_available_tickers()
+        available_tickers = load_available_tickers(
+            st.session_state.data_manager,
+            st.session_state.data_manager.db_path,
+            data_version
+        )
         
         if not available_tickers:
             st.sidebar.warning("No tickers found in database")
@@ -140,22 +274,6 @@ def render_sidebar():
         "OHLC Bars": "bars"
     }
     
-    show_volume = st.sidebar.checkbox(
-        "Show Volume",
-        value=True,
-        help="Display volume bars below the chart"
-    )
-    
-    # Theme settings
-    st.sidebar.subheader("Theme")
-    
-    theme = st.sidebar.radio(
-        "Chart Theme",
-        options=["Light", "Dark"],
-        help="Choose light or dark theme"
-    )
-    theme_lower = theme.lower()
-    
     # Chart dimensions
     st.sidebar.subheader("Chart Dimensions")
     
@@ -184,7 +302,10 @@ def render_sidebar():
     
     available_indicators = []
     if st.session_state.plugin_manager:
-        available_indicators = st.session_state.plugin_manager.get_available_plugins()
+        available_indicators, _ = load_plugin_catalog(
+            st.session_state.plugin_manager,
+            os.path.getmtime(st.session_state.plugin_manager.plugins_dir)
+        )
     
     if available_indicators:
         selected_indicators = st.sidebar.multiselect(
@@ -258,43 +379,22 @@ def render_sidebar():
         'ticker': selected_ticker,
         'timeframe': timeframe_map[timeframe],
         'chart_style': chart_style_map[chart_style],
-        'show_volume': show_volume,
-        'theme': theme_lower,
         'width': width,
         'height': height,
         'indicators': selected_indicators,
-        'indicator_params': indicator_params
+        'indicator_params': indicator_params,
+        'data_version': data_version
     }
 
 
-def render_main_content(settings):
-    """Render the main content area."""
-    if not settings:
-        return
-    
-    ticker = settings['ticker']
-    timeframe = settings['timeframe']
-    theme = settings['theme']
-    width = settings['width']
-    height = settings['height']
-    indicators = settings['indicators']
-    indicator_params = settings['indicator_params']
-    
-    # Update chart engine theme and dimensions
-    if st.session_state.chart_engine:
-        st.session_state.chart_engine.change_theme(theme)
-        st.session_state.chart_engine.width = width
-        st.session_state.chart_engine.height = height
-    
-    # Main title
-    st.title(f"📈 {ticker} Stock Chart")
-    
+def render_ticker_metrics(ticker, data_version):
+    """Render the summary metrics row for a ticker."""
     # Display ticker information
     col1, col2, col3, col4 = st.columns(4)
     
     if st.session_state.data_manager:
         try:
-            info = st.session_state.data_manager.get_ticker_info(ticker)
+            info = load_ticker_info(st.session_state.data_manager, ticker, data_version)
             
             with col1:
                 st.metric("Current Price", f"${info['current_price']:.2f}")
@@ -310,38 +410,79 @@ def render_main_content(settings):
         
         except Exception as e:
             logger.error(f"Error fetching ticker info: {e}")
-    
+
+
+@st.fragment
+def render_chart(settings):
+    """
+    Render the interactive chart as a fragment that reruns independently.
+    
+    The volume and theme controls only affect the chart, so they live inside
+    the fragment: toggling them reruns this section, not the whole script.
+    """
     # Generate and display chart
     st.subheader("Interactive Chart")
     
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        show_volume = st.checkbox(
+            "Show Volume",
+            value=True,
+            help="Display volume bars below the chart"
+        )
+    
+    with col2:
+        theme = st.radio(
+            "Chart Theme",
+            options=["Light", "Dark"],
+            horizontal=True,
+            help="Choose light or dark theme"
+        )
+    
     try:
         if st.session_state.chart_engine:
-            fig = st.session_state.chart_engine.create_candlestick_chart(
-                ticker=ticker,
-                timeframe=timeframe,
+            chart_engine = st.session_state.chart_engine
+            fig = build_chart(
+                chart_engine,
+                ticker=settings['ticker'],
+                timeframe=settings['timeframe'],
                 chart_style=settings['chart_style'],
-                indicators=indicators if indicators else None,
-                indicator_params=indicator_params if indicator_params else None,
-                show_volume=settings['show_volume']
+                width=settings['width'],
+                height=settings['height'],
+                indicators=tuple(settings['indicators']),
+                indicator_params=freeze_indicator_params(settings['indicator_params']),
+                show_volume=show_volume,
+                data_version=settings['data_version']
             )
+            # build_chart returns a fresh copy, so recoloring it is safe
+            chart_engine.apply_theme_to_figure(fig, theme.lower())
             
             st.plotly_chart(fig, use_container_width="always")
     
     except Exception as e:
         st.error(f"Error generating chart: {e}")
         logger.error(f"Chart generation error: {e}")
-    
+
+
+@st.fragment
+def render_data_table(ticker, timeframe, data_version):
+    """
+    Render the data table and export buttons.
+    
+    Runs as a fragment so clicking a download button only reruns this
+    section instead of the whole script.
+    """
     # Display data table
     st.subheader("Data Table")
     
     try:
         if st.session_state.data_manager:
-            df = st.session_state.data_manager.get_ohlcv_data(ticker)
-            df = st.session_state.data_manager.aggregate_ohlcv(df, timeframe)
+            df = load_ohlcv(st.session_state.data_manager, ticker, timeframe, data_version)
             
             # Display table
             st.dataframe(
-                df.tail(50).sort_index(ascending=False),
+                df.iloc[-50:].iloc[::-1],
                 use_container_width="always",
                 height=400
             )
@@ -350,20 +491,18 @@ def render_main_content(settings):
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                csv = df.to_csv(index=True)
                 st.download_button(
                     label="📥 Download CSV",
-                    data=csv,
+                    data=export_csv(df, ticker, timeframe),
                     file_name=f"{ticker}_{timeframe}_{datetime.now().strftime('%Y%m%d')}.csv",
                     mime="text/csv",
                     help="Download data as CSV file"
                 )
             
             with col2:
-                json = df.to_json(orient='index', indent=2)
                 st.download_button(
                     label="📥 Download JSON",
-                    data=json,
+                    data=export_json(df, ticker, timeframe),
                     file_name=f"{ticker}_{timeframe}_{datetime.now().strftime('%Y%m%d')}.json",
                     mime="application/json",
                     help="Download data as JSON file"
@@ -375,6 +514,23 @@ def render_main_content(settings):
     except Exception as e:
         st.error(f"Error displaying data: {e}")
         logger.error(f"Data display error: {e}")
+
+
+def render_main_content(settings):
+    """Render the main content area."""
+    if not settings:
+        return
+    
+    ticker = settings['ticker']
+    timeframe = settings['timeframe']
+    indicators = settings['indicators']
+    
+    # Main title
+    st.title(f"📈 {ticker} Stock Chart")
+    
+    render_ticker_metrics(ticker, settings['data_version'])
+    render_chart(settings)
+    render_data_table(ticker, timeframe, settings['data_version'])
     
     # Indicators information
     if indicators:
@@ -390,8 +546,13 @@ def render_main_content(settings):
         with col2:
             with st.expander("📖 Indicator Details", expanded=False):
                 if st.session_state.plugin_manager:
+                    _, plugin_metadata = load_plugin_catalog(
+                        st.session_state.plugin_manager,
+                        os.path.getmtime(st.session_state.plugin_manager.plugins_dir)
+                    )
+                    
                     for indicator_name in indicators:
-                        metadata = st.session_state.plugin_manager.get_plugin_metadata(indicator_name)
+                        metadata = plugin_metadata.get(indicator_name)
                         
                         if metadata:
                             st.write(f"**{metadata['name']}** v{metadata['version']}")
@@ -434,8 +595,14 @@ def main():
         st.error("Failed to initialize application. Please check your configuration.")
         return
     
+    # Drop the chart engine's memoized data once market_data.py has written
+    # new bars, so the chart and the data table agree
+    data_version = database_version(st.session_state.data_manager.db_path)
+    if st.session_state.chart_engine:
+        st.session_state.chart_engine.sync_data_version(data_version)
+    
     # Render sidebar and get settings
-    settings = render_sidebar()
+    settings = render_sidebar(data_version)
     
     # Render main content
     if settings:
@@ -5,14 +5,30 @@ Reads OHLC data from market_data.db and displays candlestick charts for tickers.
 """
 
 import sqlite3
+import numpy as np
 import pandas as pd
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 
+# Query text is kept constant so sqlite3's statement cache reuses prepared statements
+TICKERS_QUERY = "SELECT DISTINCT ticker FROM ohlc_data ORDER BY ticker"
+
+OHLC_QUERY = """
+    SELECT date, open, high, low, close, adj_close, volume 
+    FROM ohlc_data 
+    WHERE ticker = ? 
+    ORDER BY date
+"""
+
+PRICE_DTYPES = {'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64'}
+
+
 class CandlestickChartGenerator:
     """Generate candlestick charts from market data database."""
     
@@ -21,15 +37,33 @@ class CandlestickChartGenerator:
         self.db_path = db_path
         if not Path(db_path).exists():
             raise FileNotFoundError(f"Database not found: {db_path}")
+        self._conn = None
+        
+        # Build the chart style once and share it across every plot
+        mc = mpf.make_marketcolors(up='g', down='r', volume='in')
+        self._style = mpf.make_mpf_style(marketcolors=mc)
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the shared database connection, opening it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            # Keep pages cached/mapped across queries on the shared handle
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            self._conn.execute("PRAGMA cache_size=-65536")
+        return self._conn
+    
+    def close(self) -> None:
+        """Close the shared database connection if it is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
         
     def get_available_tickers(self) -> list:
         """Get all unique tickers from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT ticker FROM ohlc_data ORDER BY ticker")
+            cursor = self._get_connection().cursor()
+            cursor.execute(TICKERS_QUERY)
             tickers = [row[0] for row in cursor.fetchall()]
-            conn.close()
             return tickers
         except sqlite3.Error as e:
             print(f"Database error: {e}")
@@ -38,35 +72,25 @@ class CandlestickChartGenerator:
     def get_data_for_ticker(self, ticker: str) -> pd.DataFrame:
         """Get OHLC data for a specific ticker."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            query = """
-                SELECT date, open, high, low, close, adj_close, volume 
-                FROM ohlc_data 
-                WHERE ticker = ? 
-                ORDER BY date
-            """
-            df = pd.read_sql_query(query, conn, params=(ticker,))
-            conn.close()
+            conn = self._get_connection()
+            # Parse dates and type prices while the frame is built, not in later passes
+            df = pd.read_sql_query(
+                OHLC_QUERY, conn, params=(ticker,),
+                index_col='date', parse_dates=['date'], dtype=PRICE_DTYPES
+            )
             
             if df.empty:
                 print(f"No data found for ticker: {ticker}")
                 return None
             
-            # Convert date to datetime
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            
-            # Ensure numeric types
-            df['open'] = pd.to_numeric(df['open'], errors='coerce')
-            df['high'] = pd.to_numeric(df['high'], errors='coerce')
-            df['low'] = pd.to_numeric(df['low'], errors='coerce')
-            df['close'] = pd.to_numeric(df['close'], errors='coerce')
-            df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
-            
             return df
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return None
+        except ValueError as e:
+            # Raised by the float64 casts when a price column holds text
+            print(f"Invalid price data for ticker {ticker}: {e}")
+            return None
     
     def plot_candlestick(self, ticker: str, save_path: str = None):
         """Plot candlestick chart for a ticker."""
@@ -76,9 +100,7 @@ class CandlestickChartGenerator:
             return False
         
         try:
-            # Define colors for candlesticks
-            mc = mpf.make_marketcolors(up='g', down='r', volume='in')
-            s = mpf.make_mpf_style(marketcolors=mc)
+            s = self._style
             
             # Create the plot
             title = f"{ticker} - Daily Candlestick Chart"
@@ -95,20 +117,41 @@ class CandlestickChartGenerator:
             print(f"Error plotting chart for {ticker}: {e}")
             return False
     
-    def plot_multiple_tickers(self, tickers: list, save_dir: str = None):
-        """Plot candlestick charts for multiple tickers."""
-        if save_dir:
-            Path(save_dir).mkdir(parents=True, exist_ok=True)
+    def plot_multiple_tickers(self, tickers: list, save_dir: str = None,
+                              max_workers: int = None):
+        """
+        Plot candlestick charts for multiple tickers.
+        
+        When saving to disk the charts are rendered in parallel worker
+        processes; interactive display stays serial in this process.
+        """
+        if not save_dir:
+            success_count = 0
+            for ticker in tickers:
+                print(f"\nGenerating chart for {ticker}...")
+                if self.plot_candlestick(ticker):
+                    success_count += 1
+            return success_count
+        
+        Path(save_dir).mkdir(parents=True, exist_ok=True)
         
         success_count = 0
-        for ticker in tickers:
-            print(f"\nGenerating chart for {ticker}...")
-            save_path = None
-            if save_dir:
-                save_path = f"{save_dir}/{ticker}_candlestick.png"
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                executor.submit(
+                    _render_ticker_chart, self.db_path, ticker,
+                    f"{save_dir}/{ticker}_candlestick.png"
+                ): ticker
+                for ticker in tickers
+            }
             
-            if self.plot_candlestick(ticker, save_path):
-                success_count += 1
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    if future.result():
+                        success_count += 1
+                except Exception as e:
+                    print(f"Error plotting chart for {ticker}: {e}")
         
         return success_count
     
@@ -149,20 +192,12 @@ class CandlestickChartGenerator:
                 
                 # Plot candlesticks
                 width = 0.6
+                colors = np.where(df['close'] >= df['open'], 'g', 'r')
                 
-                # Green candles (up)
-                up = df[df['close'] >= df['open']]
-                ax.bar(up.index, up['close'] - up['open'], width, 
-                       bottom=up['open'], color='g', label='Up')
-                ax.plot(up.index, up['high'], 'g-', linewidth=0.5)
-                ax.plot(up.index, up['low'], 'g-', linewidth=0.5)
-                
-                # Red candles (down)
-                down = df[df['close'] < df['open']]
-                ax.bar(down.index, down['close'] - down['open'], width,
-                       bottom=down['close'], color='r', label='Down')
-                ax.plot(down.index, down['high'], 'r-', linewidth=0.5)
-                ax.plot(down.index, down['low'], 'r-', linewidth=0.5)
+                # Wicks as one batch of vertical segments, bodies as one bar call
+                ax.vlines(df.index, df['low'], df['high'], colors=colors, linewidth=0.5)
+                ax.bar(df.index, df['close'] - df['open'], width,
+                       bottom=df['open'], color=colors)
                 
                 ax.set_title(f"{ticker} - Daily Candlestick Chart")
                 ax.set_xlabel("Date")
@@ -188,6 +223,18 @@ class CandlestickChartGenerator:
             return False
 
 
+def _render_ticker_chart(db_path: str, ticker: str, save_path: str) -> bool:
+    """Render and save one ticker's chart inside a worker process."""
+    # Each worker uses a non-interactive backend and its own connection
+    plt.switch_backend('Agg')
+    generator = CandlestickChartGenerator(db_path)
+    try:
+        print(f"\nGenerating chart for {ticker}...")
+        return generator.plot_candlestick(ticker, save_path)
+    finally:
+        generator.close()
+
+
 def main():
     """Main function to handle command-line interface."""
     parser = argparse.ArgumentParser(
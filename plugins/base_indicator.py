@@ -8,10 +8,21 @@ indicator plugins must implement.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Tuple, Any
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+# Allowed PlotConfig values, built once rather than on every validate() call
+_VALID_PLOT_TYPES = frozenset({"line", "scatter", "bar", "histogram", "area"})
+_VALID_AXES = frozenset({"y", "y2"})
+_VALID_DASHES = frozenset({"solid", "dot", "dash", "longdash"})
+
+# OHLCV columns checked by BaseIndicator.validate_data
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+_NUMERIC_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass(slots=True)
 class ParameterDefinition:
     """Defines a configurable parameter for an indicator."""
     
@@ -34,44 +45,66 @@ class ParameterDefinition:
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
         """
-        # Type validation
-        if self.type == "int":
-            if not isinstance(value, int):
-                return (False, f"Expected int, got {type(value).__name__}")
-            if self.min_value is not None and value < self.min_value:
-                return (False, f"Value {value} is below minimum {self.min_value}")
-            if self.max_value is not None and value > self.max_value:
-                return (False, f"Value {value} is above maximum {self.max_value}")
-        
-        elif self.type == "float":
-            if not isinstance(value, (int, float)):
-                return (False, f"Expected float, got {type(value).__name__}")
-            value = float(value)
-            if self.min_value is not None and value < self.min_value:
-                return (False, f"Value {value} is below minimum {self.min_value}")
-            if self.max_value is not None and value > self.max_value:
-                return (False, f"Value {value} is above maximum {self.max_value}")
-        
-        elif self.type == "bool":
-            if not isinstance(value, bool):
-                return (False, f"Expected bool, got {type(value).__name__}")
-        
-        elif self.type == "str":
-            if not isinstance(value, str):
-                return (False, f"Expected str, got {type(value).__name__}")
-        
-        elif self.type == "choice":
-            if self.choices and value not in self.choices:
-                return (False, f"Value '{value}' not in choices: {self.choices}")
-        
-        return (True, None)
+        validator = _PARAMETER_VALIDATORS.get(self.type)
+        if validator is None:
+            return (True, None)
+        return validator(self, value)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         return asdict(self)
 
 
-@dataclass
+def _check_range(param: ParameterDefinition, value: float) -> Tuple[bool, Optional[str]]:
+    """Check a numeric value against a parameter's min/max bounds."""
+    if param.min_value is not None and value < param.min_value:
+        return (False, f"Value {value} is below minimum {param.min_value}")
+    if param.max_value is not None and value > param.max_value:
+        return (False, f"Value {value} is above maximum {param.max_value}")
+    return (True, None)
+
+
+def _validate_int(param: ParameterDefinition, value: Any) -> Tuple[bool, Optional[str]]:
+    if not isinstance(value, int):
+        return (False, f"Expected int, got {type(value).__name__}")
+    return _check_range(param, value)
+
+
+def _validate_float(param: ParameterDefinition, value: Any) -> Tuple[bool, Optional[str]]:
+    if not isinstance(value, (int, float)):
+        return (False, f"Expected float, got {type(value).__name__}")
+    return _check_range(param, float(value))
+
+
+def _validate_bool(param: ParameterDefinition, value: Any) -> Tuple[bool, Optional[str]]:
+    if not isinstance(value, bool):
+        return (False, f"Expected bool, got {type(value).__name__}")
+    return (True, None)
+
+
+def _validate_str(param: ParameterDefinition, value: Any) -> Tuple[bool, Optional[str]]:
+    if not isinstance(value, str):
+        return (False, f"Expected str, got {type(value).__name__}")
+    return (True, None)
+
+
+def _validate_choice(param: ParameterDefinition, value: Any) -> Tuple[bool, Optional[str]]:
+    if param.choices and value not in param.choices:
+        return (False, f"Value '{value}' not in choices: {param.choices}")
+    return (True, None)
+
+
+# ParameterDefinition.type -> validator; unknown types are accepted as before
+_PARAMETER_VALIDATORS = {
+    "int": _validate_int,
+    "float": _validate_float,
+    "bool": _validate_bool,
+    "str": _validate_str,
+    "choice": _validate_choice,
+}
+
+
+@dataclass(slots=True)
 class PlotConfig:
     """Defines how an indicator output should be plotted."""
     
@@ -88,16 +121,13 @@ class PlotConfig:
     
     def validate(self) -> Tuple[bool, Optional[str]]:
         """Validate plot configuration."""
-        valid_types = {"line", "scatter", "bar", "histogram", "area"}
-        if self.type not in valid_types:
+        if self.type not in _VALID_PLOT_TYPES:
             return (False, f"Invalid plot type: {self.type}")
         
-        valid_axes = {"y", "y2"}
-        if self.yaxis not in valid_axes:
+        if self.yaxis not in _VALID_AXES:
             return (False, f"Invalid yaxis: {self.yaxis}")
         
-        valid_dashes = {"solid", "dot", "dash", "longdash"}
-        if self.line_dash not in valid_dashes:
+        if self.line_dash not in _VALID_DASHES:
             return (False, f"Invalid line_dash: {self.line_dash}")
         
         if not (0 <= self.opacity <= 1):
@@ -151,6 +181,16 @@ class BaseIndicator(ABC):
         self.parameters: Dict[str, ParameterDefinition] = self._define_parameters()
         self._validate_class_attributes()
     
+    @property
+    def _values(self) -> Dict[str, Any]:
+        """
+        Current parameter values by name.
+        
+        Read from ``self.parameters`` on every access, so calculations and
+        ``get_parameters()`` always agree, however a default was assigned.
+        """
+        return {name: param.default for name, param in self.parameters.items()}
+    
     def _validate_class_attributes(self) -> None:
         """Validate that required class attributes are defined."""
         if not self.name or self.name == "Base Indicator":
@@ -188,6 +228,36 @@ class BaseIndicator(ABC):
         """
         pass
     
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Calculate indicator values from raw float64 OHLCV arrays.
+        
+        Optional fast path used by ``plugins.batch.compute_all``, which
+        extracts the arrays once and shares them between all indicators.
+        The arrays are assumed to come from data that already passed
+        ``validate_data``.
+        
+        Args:
+            high (np.ndarray): High prices
+            low (np.ndarray): Low prices
+            close (np.ndarray): Closing prices
+            volume (np.ndarray): Volumes
+        
+        Returns:
+            Optional[Dict[str, np.ndarray]]: New columns by name, or None if
+                the indicator only implements ``calculate``
+        
+        Raises:
+            ValueError: If parameters do not fit the data
+        """
+        return None
+    
     @abstractmethod
     def get_plot_configs(self) -> List[PlotConfig]:
         """
@@ -214,27 +284,44 @@ class BaseIndicator(ABC):
             errors.append("DataFrame is empty")
             return (False, errors)
         
-        required_columns = {'open', 'high', 'low', 'close', 'volume'}
-        missing_cols = required_columns - set(df.columns)
+        columns = set(df.columns)
+        missing_cols = {col for col in _NUMERIC_COLUMNS if col not in columns}
         if missing_cols:
             errors.append(f"Missing columns: {missing_cols}")
         
+        # Read dtypes once; numeric columns are checked in one NumPy block
+        dtypes = df.dtypes
+        numeric = {
+            col for col in _NUMERIC_COLUMNS
+            if col in columns and pd.api.types.is_numeric_dtype(dtypes[col])
+        }
+        price_cols = [col for col in _PRICE_COLUMNS if col in numeric]
+        prices = df[price_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        nan_counts = dict(zip(price_cols, np.isnan(prices).sum(axis=0).tolist()))
+        
         # Check for NaN in OHLC columns
-        for col in ['open', 'high', 'low', 'close']:
-            if col in df.columns and df[col].isna().sum() > 0:
-                nan_count = df[col].isna().sum()
+        for col in _PRICE_COLUMNS:
+            if col not in columns:
+                continue
+            nan_count = nan_counts[col] if col in nan_counts else df[col].isna().sum()
+            if nan_count > 0:
                 errors.append(f"Column '{col}' contains {nan_count} NaN values")
         
         # Check that high >= low
-        if 'high' in df.columns and 'low' in df.columns:
+        if 'high' in numeric and 'low' in numeric:
+            invalid_rows = int(np.count_nonzero(
+                prices[:, price_cols.index('high')] < prices[:, price_cols.index('low')]
+            ))
+        elif 'high' in columns and 'low' in columns:
             invalid_rows = (df['high'] < df['low']).sum()
-            if invalid_rows > 0:
-                errors.append(f"{invalid_rows} rows have high < low")
+        else:
+            invalid_rows = 0
+        if invalid_rows > 0:
+            errors.append(f"{invalid_rows} rows have high < low")
         
         # Check data types
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_cols:
-            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+        for col in _NUMERIC_COLUMNS:
+            if col in columns and col not in numeric:
                 errors.append(f"Column '{col}' is not numeric")
         
         return (len(errors) == 0, errors)
@@ -290,10 +377,7 @@ class BaseIndicator(ABC):
         Returns:
             Dict[str, Any]: Current parameter values
         """
-        return {
-            name: param.default
-            for name, param in self.parameters.items()
-        }
+        return self._values
     
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,102 @@
+"""
+Batched Indicator Calculation
+
+Runs several indicators over the same OHLCV data in one go. The price and
+volume columns are converted to contiguous float64 arrays once and shared
+by every indicator's ``calculate_arrays`` kernel, and all output columns are
+attached with a single ``assign`` instead of one DataFrame per indicator.
+"""
+
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from plugins.base_indicator import BaseIndicator
+
+
+def ohlcv_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract high, low, close and volume as contiguous float64 arrays.
+    
+    Args:
+        df (pd.DataFrame): OHLCV data
+    
+    Returns:
+        Tuple[np.ndarray, ...]: (high, low, close, volume)
+    """
+    # Always copy: pandas may hand out read-only views, which numba compiles
+    # as a separate signature from the one plugins.kernels.warmup compiles
+    return tuple(
+        np.array(df[col].to_numpy(), dtype=np.float64, order='C')
+        for col in ('high', 'low', 'close', 'volume')
+    )
+
+
+def compute_columns(
+    df: pd.DataFrame,
+    indicators: List[BaseIndicator]
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Calculate the output columns of several indicators over the same data.
+    
+    Indicators without an array implementation fall back to ``calculate``
+    on the data accumulated so far, so they still see earlier outputs.
+    
+    Args:
+        df (pd.DataFrame): OHLCV data
+        indicators (List[BaseIndicator]): Configured indicator instances
+    
+    Returns:
+        List[Dict[str, np.ndarray]]: New columns of each indicator, in order
+    
+    Raises:
+        ValueError: If data validation or an indicator calculation fails;
+            calculation errors are prefixed with the indicator name
+    """
+    if not indicators:
+        return []
+    
+    # The data checks are the same for every indicator; run them once
+    is_valid, errors = indicators[0].validate_data(df)
+    if not is_valid:
+        raise ValueError(f"Data validation failed: {'; '.join(errors)}")
+    
+    arrays = ohlcv_arrays(df)
+    results: Dict[str, np.ndarray] = {}
+    outputs: List[Dict[str, np.ndarray]] = []
+    
+    for indicator in indicators:
+        try:
+            columns = indicator.calculate_arrays(*arrays)
+            if columns is None:
+                current = df.assign(**results) if results else df
+                calculated = indicator.calculate(current)
+                columns = {
+                    col: calculated[col].to_numpy()
+                    for col in calculated.columns if col not in current.columns
+                }
+        except Exception as e:
+            raise ValueError(f"Error calculating {indicator.name}: {e}")
+        results.update(columns)
+        outputs.append(columns)
+    
+    return outputs
+
+
+def compute_all(df: pd.DataFrame, indicators: List[BaseIndicator]) -> pd.DataFrame:
+    """
+    Calculate several indicators over the same OHLCV data.
+    
+    Args:
+        df (pd.DataFrame): OHLCV data
+        indicators (List[BaseIndicator]): Configured indicator instances
+    
+    Returns:
+        pd.DataFrame: Original data with all indicator columns added
+    
+    Raises:
+        ValueError: If data validation or an indicator calculation fails
+    """
+    results: Dict[str, np.ndarray] = {}
+    for columns in compute_columns(df, indicators):
+        results.update(columns)
+    return df.assign(**results) if results else df
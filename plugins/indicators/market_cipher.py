@@ -12,6 +12,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List
 from plugins.base_indicator import BaseIndicator, ParameterDefinition, PlotConfig
+from plugins.batch import ohlcv_arrays
+from plugins.kernels import market_cipher_b, wave_trend
 
 
 class MarketCipherA(BaseIndicator):
@@ -74,14 +76,6 @@ class MarketCipherA(BaseIndicator):
             )
         }
     
-    def _ema(self, series: pd.Series, period: int) -> pd.Series:
-        """Calculate Exponential Moving Average."""
-        return series.ewm(span=period, adjust=False).mean()
-    
-    def _hlc3(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate typical price (HLC3)."""
-        return (df['high'] + df['low'] + df['close']) / 3
-    
     def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate Market Cipher A (Wave Trend).
@@ -102,39 +96,34 @@ class MarketCipherA(BaseIndicator):
             if col not in df.columns:
                 raise KeyError(f"DataFrame must contain '{col}' column")
         
-        channel_length = self.parameters['channel_length'].default
-        average_length = self.parameters['average_length'].default
-        
-        df_copy = df.copy()
-        
-        # Calculate HLC3 (typical price)
-        hlc3 = self._hlc3(df_copy)
-        
-        # Calculate EMA of HLC3
-        esa = self._ema(hlc3, channel_length)
-        
-        # Calculate EMA of absolute difference
-        d = self._ema(abs(hlc3 - esa), channel_length)
-        
-        # Calculate CI (Commodity Index)
-        # Add small epsilon to avoid division by zero
-        ci = (hlc3 - esa) / (0.015 * d + 1e-10)
-        
-        # Calculate Wave Trend 1 (WT1)
-        wt1 = self._ema(ci, average_length)
+        # Attach new columns; assign() shares the existing OHLCV columns
+        return df.assign(**self.calculate_arrays(*ohlcv_arrays(df)))
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the Wave Trend columns from raw arrays.
         
-        # Calculate Wave Trend 2 (WT2) - SMA of WT1
-        wt2 = wt1.rolling(window=4).mean()
+        Args:
+            high, low, close, volume (np.ndarray): Float64 OHLCV arrays
         
-        # Calculate histogram (difference between WT1 and WT2)
-        wt_hist = wt1 - wt2
+        Returns:
+            Dict[str, np.ndarray]: Wave Trend columns by name
+        """
+        channel_length = self._values['channel_length']
+        average_length = self._values['average_length']
         
-        # Add to dataframe
-        df_copy['MCA_WT1'] = wt1
-        df_copy['MCA_WT2'] = wt2
-        df_copy['MCA_Hist'] = wt_hist
+        # HLC3 -> ESA -> D -> CI -> WT1 -> WT2 in one fused pass
+        wt1, wt2, wt_hist = wave_trend(
+            high, low, close, channel_length, average_length
+        )
         
-        return df_copy
+        return {'MCA_WT1': wt1, 'MCA_WT2': wt2, 'MCA_Hist': wt_hist}
     
     def get_plot_configs(self) -> List[PlotConfig]:
         """Define how Market Cipher A should be plotted."""
@@ -231,68 +220,6 @@ class MarketCipherB(BaseIndicator):
             )
         }
     
-    def _ema(self, series: pd.Series, period: int) -> pd.Series:
-        """Calculate Exponential Moving Average."""
-        return series.ewm(span=period, adjust=False).mean()
-    
-    def _sma(self, series: pd.Series, period: int) -> pd.Series:
-        """Calculate Simple Moving Average."""
-        return series.rolling(window=period).mean()
-    
-    def _hlc3(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate typical price (HLC3)."""
-        return (df['high'] + df['low'] + df['close']) / 3
-    
-    def _calculate_mfi(self, df: pd.DataFrame, length: int) -> pd.Series:
-        """
-        Calculate Money Flow Index.
-        
-        MFI uses both price and volume to measure buying and selling pressure.
-        """
-        typical_price = self._hlc3(df)
-        raw_money_flow = typical_price * df['volume']
-        
-        # Calculate positive and negative money flow
-        price_change = typical_price.diff()
-        
-        positive_flow = pd.Series(0.0, index=df.index)
-        negative_flow = pd.Series(0.0, index=df.index)
-        
-        positive_flow[price_change > 0] = raw_money_flow[price_change > 0]
-        negative_flow[price_change < 0] = raw_money_flow[price_change < 0]
-        
-        # Calculate MFI
-        positive_mf = positive_flow.rolling(window=length).sum()
-        negative_mf = negative_flow.rolling(window=length).sum()
-        
-        # Add small epsilon to avoid division by zero
-        mfi = 100 - (100 / (1 + positive_mf / (negative_mf + 1e-10)))
-        
-        # Scale MFI to oscillator range (-100 to 100)
-        mfi_scaled = (mfi - 50) * 2
-        
-        return mfi_scaled
-    
-    def _calculate_wave_trend(self, df: pd.DataFrame, channel_length: int, 
-                               average_length: int) -> tuple:
-        """Calculate Wave Trend oscillator components."""
-        hlc3 = self._hlc3(df)
-        
-        # EMA of HLC3
-        esa = self._ema(hlc3, channel_length)
-        
-        # EMA of absolute difference
-        d = self._ema(abs(hlc3 - esa), channel_length)
-        
-        # CI (Commodity Index) - add epsilon to avoid division by zero
-        ci = (hlc3 - esa) / (0.015 * d + 1e-10)
-        
-        # Wave Trend 1 and 2
-        wt1 = self._ema(ci, average_length)
-        wt2 = self._sma(wt1, 4)
-        
-        return wt1, wt2
-    
     def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate Market Cipher B indicators.
@@ -313,41 +240,54 @@ class MarketCipherB(BaseIndicator):
             if col not in df.columns:
                 raise KeyError(f"DataFrame must contain '{col}' column")
         
-        channel_length = self.parameters['channel_length'].default
-        average_length = self.parameters['average_length'].default
-        mfi_length = self.parameters['mfi_length'].default
-        overbought = self.parameters['overbought'].default
-        oversold = self.parameters['oversold'].default
-        
-        df_copy = df.copy()
-        
-        # Calculate Wave Trend
-        wt1, wt2 = self._calculate_wave_trend(df_copy, channel_length, average_length)
+        # Attach new columns; assign() shares the existing OHLCV columns
+        return df.assign(**self.calculate_arrays(*ohlcv_arrays(df)))
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the Market Cipher B columns from raw arrays.
         
-        # Calculate Money Flow
-        mfi = self._calculate_mfi(df_copy, mfi_length)
+        Args:
+            high, low, close, volume (np.ndarray): Float64 OHLCV arrays
         
-        # Calculate histogram
-        wt_hist = wt1 - wt2
+        Returns:
+            Dict[str, np.ndarray]: Market Cipher B columns by name
+        """
+        channel_length = self._values['channel_length']
+        average_length = self._values['average_length']
+        mfi_length = self._values['mfi_length']
+        overbought = self._values['overbought']
+        oversold = self._values['oversold']
         
-        # Detect momentum dots (crossovers in oversold/overbought zones)
+        # Wave trend, money flow and momentum dots in one kernel
         # Buy dots: WT1 crosses above WT2 in oversold zone
         # Sell dots: WT1 crosses below WT2 in overbought zone
-        cross_up = (wt1 > wt2) & (wt1.shift(1) <= wt2.shift(1))
-        cross_down = (wt1 < wt2) & (wt1.shift(1) >= wt2.shift(1))
-        
-        buy_signal = cross_up & (wt2 < oversold)
-        sell_signal = cross_down & (wt2 > overbought)
-        
-        # Add columns to dataframe
-        df_copy['MCB_WT1'] = wt1
-        df_copy['MCB_WT2'] = wt2
-        df_copy['MCB_MFI'] = mfi
-        df_copy['MCB_Hist'] = wt_hist
-        df_copy['MCB_Buy'] = buy_signal.astype(int) * oversold  # Plot at oversold level
-        df_copy['MCB_Sell'] = sell_signal.astype(int) * overbought  # Plot at overbought level
+        wt1, wt2, wt_hist, mfi, buy, sell = market_cipher_b(
+            high,
+            low,
+            close,
+            volume,
+            channel_length,
+            average_length,
+            mfi_length,
+            overbought,
+            oversold
+        )
         
-        return df_copy
+        return {
+            'MCB_WT1': wt1,
+            'MCB_WT2': wt2,
+            'MCB_MFI': mfi,
+            'MCB_Hist': wt_hist,
+            'MCB_Buy': buy,  # Plot at oversold level
+            'MCB_Sell': sell  # Plot at overbought level
+        }
     
     def get_plot_configs(self) -> List[PlotConfig]:
         """Define how Market Cipher B should be plotted."""
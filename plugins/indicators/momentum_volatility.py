@@ -9,6 +9,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List
 from plugins.base_indicator import BaseIndicator, ParameterDefinition, PlotConfig
+from plugins.batch import ohlcv_arrays
+from plugins.kernels import bollinger_bands, rsi_sma
 
 
 class RelativeStrengthIndex(BaseIndicator):
@@ -79,39 +81,43 @@ class RelativeStrengthIndex(BaseIndicator):
         if 'close' not in df.columns:
             raise KeyError("DataFrame must contain 'close' column")
         
-        period = self.parameters['period'].default
-        
-        if period > len(df):
-            raise ValueError(
-                f"Period ({period}) cannot be greater than data length ({len(df)})"
-            )
-        
-        df_copy = df.copy()
-        
-        # Calculate price changes
-        delta = df_copy['close'].diff()
+        # Attach new column; assign() shares the existing OHLCV columns
+        return df.assign(**self.calculate_arrays(*ohlcv_arrays(df)))
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the RSI column from raw arrays.
         
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        Args:
+            high, low, close, volume (np.ndarray): Float64 OHLCV arrays
         
-        # Calculate average gain and loss
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+        Returns:
+            Dict[str, np.ndarray]: RSI column by name
         
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        Raises:
+            ValueError: If period is greater than the data length
+        """
+        period = self._values['period']
         
-        df_copy[f'RSI_{period}'] = rsi
+        if period > len(close):
+            raise ValueError(
+                f"Period ({period}) cannot be greater than data length ({len(close)})"
+            )
         
-        return df_copy
+        # Gains/losses and their rolling averages in a single compiled pass
+        return {f'RSI_{period}': rsi_sma(close, period)}
     
     def get_plot_configs(self) -> List[PlotConfig]:
         """Define how the RSI should be plotted."""
-        period = self.parameters['period'].default
-        overbought = self.parameters['overbought'].default
-        oversold = self.parameters['oversold'].default
+        period = self._values['period']
+        overbought = self._values['overbought']
+        oversold = self._values['oversold']
         
         return [
             PlotConfig(
@@ -192,40 +198,51 @@ class BollingerBands(BaseIndicator):
         if 'close' not in df.columns:
             raise KeyError("DataFrame must contain 'close' column")
         
-        period = self.parameters['period'].default
-        multiplier = self.parameters['multiplier'].default
-        
-        if period > len(df):
-            raise ValueError(
-                f"Period ({period}) cannot be greater than data length ({len(df)})"
-            )
-        
-        df_copy = df.copy()
+        # Attach new columns; assign() shares the existing OHLCV columns
+        return df.assign(**self.calculate_arrays(*ohlcv_arrays(df)))
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the Bollinger Bands columns from raw arrays.
         
-        # Calculate middle band (SMA)
-        middle_band = df_copy['close'].rolling(window=period).mean()
+        Args:
+            high, low, close, volume (np.ndarray): Float64 OHLCV arrays
         
-        # Calculate standard deviation
-        std_dev = df_copy['close'].rolling(window=period).std()
+        Returns:
+            Dict[str, np.ndarray]: Band columns by name
         
-        # Calculate upper and lower bands
-        upper_band = middle_band + (std_dev * multiplier)
-        lower_band = middle_band - (std_dev * multiplier)
+        Raises:
+            ValueError: If period is greater than the data length
+        """
+        period = self._values['period']
+        multiplier = self._values['multiplier']
         
-        # Calculate bandwidth
-        band_width = upper_band - lower_band
+        if period > len(close):
+            raise ValueError(
+                f"Period ({period}) cannot be greater than data length ({len(close)})"
+            )
         
-        # Add to dataframe
-        df_copy[f'BB_Middle_{period}'] = middle_band
-        df_copy[f'BB_Upper_{period}'] = upper_band
-        df_copy[f'BB_Lower_{period}'] = lower_band
-        df_copy[f'BB_Width_{period}'] = band_width
+        # Middle band (SMA), standard deviation and bands in one pass
+        middle_band, upper_band, lower_band, band_width = bollinger_bands(
+            close, period, float(multiplier)
+        )
         
-        return df_copy
+        return {
+            f'BB_Middle_{period}': middle_band,
+            f'BB_Upper_{period}': upper_band,
+            f'BB_Lower_{period}': lower_band,
+            f'BB_Width_{period}': band_width
+        }
     
     def get_plot_configs(self) -> List[PlotConfig]:
         """Define how the Bollinger Bands should be plotted."""
-        period = self.parameters['period'].default
+        period = self._values['period']
         
         return [
             PlotConfig(
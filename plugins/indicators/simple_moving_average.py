@@ -5,9 +5,12 @@ A basic technical indicator that calculates the average closing price
 over a specified number of periods.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Tuple
 from plugins.base_indicator import BaseIndicator, ParameterDefinition, PlotConfig
+from plugins.batch import ohlcv_arrays
+from plugins.kernels import ema, sma_cumsum
 
 
 class SimpleMovingAverage(BaseIndicator):
@@ -61,24 +64,42 @@ class SimpleMovingAverage(BaseIndicator):
         if 'close' not in df.columns:
             raise KeyError("DataFrame must contain 'close' column")
         
+        # Attach new column; assign() shares the existing OHLCV columns
+        return df.assign(**self.calculate_arrays(*ohlcv_arrays(df)))
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the SMA column from raw arrays.
+        
+        Args:
+            high, low, close, volume (np.ndarray): Float64 OHLCV arrays
+        
+        Returns:
+            Dict[str, np.ndarray]: SMA column by name
+        
+        Raises:
+            ValueError: If period is greater than the data length
+        """
         # Get the period
-        period = self.parameters['period'].default
+        period = self._values['period']
         
         # Validate period
-        if period > len(df):
+        if period > len(close):
             raise ValueError(
-                f"Period ({period}) cannot be greater than data length ({len(df)})"
+                f"Period ({period}) cannot be greater than data length ({len(close)})"
             )
         
-        # Calculate SMA
-        df_copy = df.copy()
-        df_copy[f'SMA_{period}'] = df_copy['close'].rolling(window=period).mean()
-        
-        return df_copy
+        return {f'SMA_{period}': sma_cumsum(close, period)}
     
     def get_plot_configs(self) -> List[PlotConfig]:
         """Define how the SMA should be plotted."""
-        period = self.parameters['period'].default
+        period = self._values['period']
         
         return [
             PlotConfig(
@@ -143,21 +164,40 @@ class ExponentialMovingAverage(BaseIndicator):
         if 'close' not in df.columns:
             raise KeyError("DataFrame must contain 'close' column")
         
-        period = self.parameters['period'].default
+        # Attach new column; assign() shares the existing OHLCV columns
+        return df.assign(**self.calculate_arrays(*ohlcv_arrays(df)))
+    
+    def calculate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the EMA column from raw arrays.
+        
+        Args:
+            high, low, close, volume (np.ndarray): Float64 OHLCV arrays
+        
+        Returns:
+            Dict[str, np.ndarray]: EMA column by name
         
-        if period > len(df):
+        Raises:
+            ValueError: If period is greater than the data length
+        """
+        period = self._values['period']
+        
+        if period > len(close):
             raise ValueError(
-                f"Period ({period}) cannot be greater than data length ({len(df)})"
+                f"Period ({period}) cannot be greater than data length ({len(close)})"
             )
         
-        df_copy = df.copy()
-        df_copy[f'EMA_{period}'] = df_copy['close'].ewm(span=period, adjust=False).mean()
-        
-        return df_copy
+        return {f'EMA_{period}': ema(close, period)}
     
     def get_plot_configs(self) -> List[PlotConfig]:
         """Define how the EMA should be plotted."""
-        period = self.parameters['period'].default
+        period = self._values['period']
         
         return [
             PlotConfig(
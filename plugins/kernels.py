@@ -0,0 +1,340 @@
+"""
+Compiled Indicator Kernels
+
+Single-pass NumPy loops and vectorized helpers shared by the indicator
+plugins. When numba is installed the loops are JIT-compiled; otherwise they
+run as plain Python so the plugins keep working without the optional
+dependency.
+
+Call ``warmup()`` once at start-up to compile (or load from numba's on-disk
+cache) the kernels the plugins call, so the first chart render does not
+stall on JIT compilation.
+
+Kernels return arrays in the floating dtype of their inputs, so float32
+inputs halve memory traffic; running sums are still accumulated in float64.
+The built-in plugins pass float64, since float32 only resolves about 0.01
+at the price levels of tickers such as BTC-USD.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average, equivalent to ``ewm(span=period, adjust=False).mean()``.
+
+    Args:
+        values (np.ndarray): Input series (float64, NaN-free)
+        period (int): EMA span
+
+    Returns:
+        np.ndarray: EMA values, seeded with the first input
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    if n == 0:
+        return out
+    k = 2.0 / (period + 1.0)
+    out[0] = values[0]
+    for i in range(1, n):
+        out[i] = k * values[i] + (1.0 - k) * out[i - 1]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rsi_sma(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI from simple moving averages of gains and losses, in one pass.
+
+    Matches ``diff`` -> ``where`` -> ``rolling(period).mean()``: the first
+    bar contributes a zero change, so values start at index ``period - 1``.
+    Window sums are reset to exactly zero whenever the window holds no
+    gains (or losses), so flat stretches give exact 100/NaN like pandas.
+
+    Args:
+        close (np.ndarray): Closing prices (float64)
+        period (int): Averaging window
+
+    Returns:
+        np.ndarray: RSI values, NaN during warm-up
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan, dtype=close.dtype)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    gain_count = 0
+    loss_count = 0
+    for i in range(n):
+        # Bar entering the window
+        delta = close[i] - close[i - 1] if i > 0 else 0.0
+        if delta > 0:
+            gain_sum += delta
+            gain_count += 1
+        elif delta < 0:
+            loss_sum -= delta
+            loss_count += 1
+        # Bar leaving the window (recomputed instead of buffering the deltas)
+        j = i - period
+        if j >= 1:
+            delta = close[j] - close[j - 1]
+            if delta > 0:
+                gain_sum -= delta
+                gain_count -= 1
+            elif delta < 0:
+                loss_sum += delta
+                loss_count -= 1
+        if gain_count == 0:
+            gain_sum = 0.0
+        if loss_count == 0:
+            loss_sum = 0.0
+        if i >= period - 1:
+            if loss_sum == 0.0:
+                out[i] = np.nan if gain_sum == 0.0 else 100.0
+            else:
+                out[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+    return out
+
+
+
+@njit(cache=True, nogil=True)
+def typical_price(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Typical price (HLC3) in the dtype of the inputs."""
+    return ((high + low + close) / 3.0).astype(close.dtype)
+
+
+@njit(cache=True, nogil=True)
+def wave_trend_from_hlc3(hlc3: np.ndarray, channel_length: int, average_length: int):
+    """
+    Wave Trend (ESA -> D -> CI -> WT1 -> WT2) fused into one pass over HLC3.
+
+    EMAs follow ``ewm(span=..., adjust=False)`` and WT2 is the 4-bar simple
+    average of WT1, so results match the pandas chain while keeping every
+    intermediate in scalars.
+
+    Args:
+        hlc3 (np.ndarray): Typical price from ``typical_price`` (NaN-free)
+        channel_length (int): Span of the ESA and D averages
+        average_length (int): Span of the WT1 average
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (wt1, wt2, wt1 - wt2)
+    """
+    n = hlc3.shape[0]
+    wt1 = np.empty(n, dtype=hlc3.dtype)
+    wt2 = np.full(n, np.nan, dtype=hlc3.dtype)
+    hist = np.full(n, np.nan, dtype=hlc3.dtype)
+    k1 = 2.0 / (channel_length + 1.0)
+    k2 = 2.0 / (average_length + 1.0)
+    esa = 0.0
+    d = 0.0
+    for i in range(n):
+        tp = hlc3[i]
+        esa = tp if i == 0 else k1 * tp + (1.0 - k1) * esa
+        dev = tp - esa
+        d = 0.0 if i == 0 else k1 * abs(dev) + (1.0 - k1) * d
+        # Small epsilon avoids division by zero
+        ci = dev / (0.015 * d + 1e-10)
+        wt1[i] = ci if i == 0 else k2 * ci + (1.0 - k2) * wt1[i - 1]
+        if i >= 3:
+            wt2[i] = (wt1[i - 3] + wt1[i - 2] + wt1[i - 1] + wt1[i]) / 4.0
+            hist[i] = wt1[i] - wt2[i]
+    return wt1, wt2, hist
+
+
+@njit(cache=True, nogil=True)
+def wave_trend(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               channel_length: int, average_length: int):
+    """
+    Wave Trend (HLC3 -> ESA -> D -> CI -> WT1 -> WT2).
+
+    Args:
+        high, low, close (np.ndarray): Price arrays (NaN-free)
+        channel_length (int): Span of the ESA and D averages
+        average_length (int): Span of the WT1 average
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (wt1, wt2, wt1 - wt2)
+    """
+    return wave_trend_from_hlc3(
+        typical_price(high, low, close), channel_length, average_length
+    )
+
+
+@njit(cache=True, nogil=True)
+def market_cipher_b(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    volume: np.ndarray, channel_length: int, average_length: int,
+                    mfi_length: int, overbought: int, oversold: int):
+    """
+    Market Cipher B: wave trend, money flow and crossover dots.
+
+    Computes the typical price once, shares it between the wave trend pass
+    and a single loop that keeps the positive and
+    negative money-flow window sums as running totals (O(1) per bar instead
+    of O(mfi_length)) and detects WT1/WT2 crossovers as sign changes of the
+    histogram, without shifted copies.
+
+    Args:
+        high, low, close, volume (np.ndarray): OHLCV arrays (float64, NaN-free)
+        channel_length (int): Span of the ESA and D averages
+        average_length (int): Span of the WT1 average
+        mfi_length (int): Money flow window
+        overbought (int): Sell dots require WT2 above this level
+        oversold (int): Buy dots require WT2 below this level
+
+    Returns:
+        Tuple of arrays: (wt1, wt2, hist, mfi, buy, sell), where mfi is scaled
+        to -100..100 and buy/sell hold the oversold/overbought level on
+        signal bars and 0 elsewhere
+    """
+    hlc3 = typical_price(high, low, close)
+    wt1, wt2, hist = wave_trend_from_hlc3(hlc3, channel_length, average_length)
+
+    n = close.shape[0]
+    mfi = np.full(n, np.nan, dtype=hlc3.dtype)
+    buy = np.zeros(n, dtype=np.int64)
+    sell = np.zeros(n, dtype=np.int64)
+    pos_sum = 0.0
+    neg_sum = 0.0
+    pos_count = 0
+    neg_count = 0
+    for i in range(n):
+        # Bar entering the money-flow window
+        if i > 0:
+            if hlc3[i] > hlc3[i - 1]:
+                pos_sum += hlc3[i] * volume[i]
+                pos_count += 1
+            elif hlc3[i] < hlc3[i - 1]:
+                neg_sum += hlc3[i] * volume[i]
+                neg_count += 1
+        # Bar leaving the window (recomputed instead of buffering the flows)
+        j = i - mfi_length
+        if j >= 1:
+            if hlc3[j] > hlc3[j - 1]:
+                pos_sum -= hlc3[j] * volume[j]
+                pos_count -= 1
+            elif hlc3[j] < hlc3[j - 1]:
+                neg_sum -= hlc3[j] * volume[j]
+                neg_count -= 1
+        if pos_count == 0:
+            pos_sum = 0.0
+        if neg_count == 0:
+            neg_sum = 0.0
+        if i >= mfi_length - 1:
+            # Small epsilon avoids division by zero
+            value = 100.0 - 100.0 / (1.0 + pos_sum / (neg_sum + 1e-10))
+            mfi[i] = (value - 50.0) * 2.0
+
+        # Crossovers are sign changes of hist = wt1 - wt2 against the previous
+        # bar; NaN comparisons are False
+        if i > 0:
+            if hist[i] > 0.0 and hist[i - 1] <= 0.0 and wt2[i] < oversold:
+                buy[i] = oversold
+            elif hist[i] < 0.0 and hist[i - 1] >= 0.0 and wt2[i] > overbought:
+                sell[i] = overbought
+    return wt1, wt2, hist, mfi, buy, sell
+
+
+@njit(cache=True, nogil=True)
+def bollinger_bands(close: np.ndarray, period: int, multiplier: float):
+    """
+    Bollinger Bands from a sliding Welford mean/variance, in one pass.
+
+    Matches ``rolling(period).mean()`` and ``rolling(period).std()``
+    (sample std, ddof=1). Windows of identical values give exactly zero
+    deviation, as pandas does, instead of accumulated rounding noise.
+
+    Args:
+        close (np.ndarray): Closing prices (float64, NaN-free)
+        period (int): Window for the mean and standard deviation
+        multiplier (float): Standard deviation multiplier for the bands
+
+    Returns:
+        Tuple of arrays: (middle, upper, lower, width), NaN during warm-up
+    """
+    n = close.shape[0]
+    middle = np.full(n, np.nan, dtype=close.dtype)
+    upper = np.full(n, np.nan, dtype=close.dtype)
+    lower = np.full(n, np.nan, dtype=close.dtype)
+    width = np.full(n, np.nan, dtype=close.dtype)
+    mean = 0.0
+    m2 = 0.0
+    same_run = 0
+    for i in range(n):
+        x = close[i]
+        same_run = same_run + 1 if i > 0 and x == close[i - 1] else 1
+        if i < period:
+            # Growing window: standard Welford update
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            # Full window: replace the leaving value in one update
+            y = close[i - period]
+            new_mean = mean + (x - y) / period
+            m2 += (x - y) * (x - new_mean + y - mean)
+            mean = new_mean
+        if i >= period - 1:
+            if same_run >= period:
+                mean = x
+                m2 = 0.0
+            elif m2 < 0.0:
+                m2 = 0.0
+            std = np.sqrt(m2 / (period - 1))
+            middle[i] = mean
+            upper[i] = mean + std * multiplier
+            lower[i] = mean - std * multiplier
+            width[i] = upper[i] - lower[i]
+    return middle, upper, lower, width
+
+
+def sma_cumsum(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average via differences of a cumulative sum.
+
+    O(n) regardless of ``period``. Input must be NaN-free (a NaN would
+    poison every later window), which validated OHLC data guarantees.
+
+    Args:
+        values (np.ndarray): Input series
+        period (int): Averaging window
+
+    Returns:
+        np.ndarray: Moving average, NaN for the first ``period - 1`` values
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=values.dtype)
+    if period > n:
+        return out
+    csum = np.cumsum(values, dtype=np.float64)
+    out[period - 1] = csum[period - 1]
+    out[period:] = csum[period:] - csum[:-period]
+    out[period - 1:] /= period
+    return out
+
+
+def warmup() -> None:
+    """
+    Compile the plugin-facing kernels for the signatures the plugins use.
+
+    Calls each kernel on a small float64 array with int periods and float
+    multipliers, matching the calls made from ``calculate_arrays``.
+    """
+    values = np.linspace(1.0, 2.0, 64)
+    ema(values, 12)
+    rsi_sma(values, 14)
+    bollinger_bands(values, 20, 2.0)
+    wave_trend(values, values, values, 9, 12)
+    market_cipher_b(values, values, values, values, 9, 12, 60, 53, -53)
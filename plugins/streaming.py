@@ -0,0 +1,348 @@
+"""
+Streaming Indicator Variants
+
+Incremental versions of the built-in indicators for live updates. Each class
+keeps O(1) running state (window sums, EMA states, short ring buffers) and
+consumes one bar per ``update`` call instead of recomputing the whole
+history, while producing the same values and column names as the batch
+plugins in ``plugins.indicators``.
+
+Example:
+    sma = StreamingSMA(period=20)
+    for bar in bars:
+        values = sma.update(bar.high, bar.low, bar.close, bar.volume)
+        # values == {'SMA_20': ...}, NaN until 20 bars have been seen
+"""
+
+import math
+from collections import deque
+from typing import Dict
+
+
+class StreamingSMA:
+    """Simple moving average of closing prices (``SMA_{period}``)."""
+
+    def __init__(self, period: int = 20):
+        self.period = period
+        self._window = deque(maxlen=period)
+        self._sum = 0.0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """
+        Add one bar.
+
+        Args:
+            high, low, close, volume (float): The new bar
+
+        Returns:
+            Dict[str, float]: SMA value, NaN during warm-up
+        """
+        if len(self._window) == self.period:
+            self._sum -= self._window[0]
+        self._window.append(close)
+        self._sum += close
+
+        value = self._sum / self.period if len(self._window) == self.period else math.nan
+        return {f'SMA_{self.period}': value}
+
+
+class StreamingEMA:
+    """Exponential moving average of closing prices (``EMA_{period}``)."""
+
+    def __init__(self, period: int = 12):
+        self.period = period
+        self._k = 2.0 / (period + 1.0)
+        self._value = None
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """
+        Add one bar.
+
+        Args:
+            high, low, close, volume (float): The new bar
+
+        Returns:
+            Dict[str, float]: EMA value, seeded with the first close
+        """
+        if self._value is None:
+            self._value = close
+        else:
+            self._value = self._k * close + (1.0 - self._k) * self._value
+        return {f'EMA_{self.period}': self._value}
+
+
+class StreamingRSI:
+    """
+    Relative Strength Index (``RSI_{period}``).
+
+    Uses simple moving averages of gains and losses like the RSI plugin;
+    the first bar counts as a zero change.
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._deltas = deque(maxlen=period)
+        self._prev_close = None
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._gain_count = 0
+        self._loss_count = 0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """
+        Add one bar.
+
+        Args:
+            high, low, close, volume (float): The new bar
+
+        Returns:
+            Dict[str, float]: RSI value, NaN during warm-up
+        """
+        if len(self._deltas) == self.period:
+            leaving = self._deltas[0]
+            if leaving > 0:
+                self._gain_sum -= leaving
+                self._gain_count -= 1
+            elif leaving < 0:
+                self._loss_sum += leaving
+                self._loss_count -= 1
+
+        delta = 0.0 if self._prev_close is None else close - self._prev_close
+        self._prev_close = close
+        self._deltas.append(delta)
+        if delta > 0:
+            self._gain_sum += delta
+            self._gain_count += 1
+        elif delta < 0:
+            self._loss_sum -= delta
+            self._loss_count += 1
+
+        # Empty sides reset to exactly zero so flat stretches give 100/NaN
+        if self._gain_count == 0:
+            self._gain_sum = 0.0
+        if self._loss_count == 0:
+            self._loss_sum = 0.0
+
+        if len(self._deltas) < self.period:
+            value = math.nan
+        elif self._loss_sum == 0.0:
+            value = math.nan if self._gain_sum == 0.0 else 100.0
+        else:
+            value = 100.0 - 100.0 / (1.0 + self._gain_sum / self._loss_sum)
+        return {f'RSI_{self.period}': value}
+
+
+class StreamingBB:
+    """
+    Bollinger Bands (``BB_Middle/Upper/Lower/Width_{period}``).
+
+    Keeps a sliding Welford mean and sum of squared deviations, so the
+    sample standard deviation needs no pass over the window.
+    """
+
+    def __init__(self, period: int = 20, multiplier: float = 2.0):
+        self.period = period
+        self.multiplier = multiplier
+        self._window = deque(maxlen=period)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._same_run = 0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """
+        Add one bar.
+
+        Args:
+            high, low, close, volume (float): The new bar
+
+        Returns:
+            Dict[str, float]: Band values, NaN during warm-up
+        """
+        window = self._window
+        self._same_run = self._same_run + 1 if window and close == window[-1] else 1
+
+        if len(window) < self.period:
+            # Growing window: standard Welford update
+            delta = close - self._mean
+            self._mean += delta / (len(window) + 1)
+            self._m2 += delta * (close - self._mean)
+        else:
+            # Full window: replace the leaving value in one update
+            leaving = window[0]
+            new_mean = self._mean + (close - leaving) / self.period
+            self._m2 += (close - leaving) * (close - new_mean + leaving - self._mean)
+            self._mean = new_mean
+        window.append(close)
+
+        period = self.period
+        if len(window) < period:
+            nan = math.nan
+            return {
+                f'BB_Middle_{period}': nan,
+                f'BB_Upper_{period}': nan,
+                f'BB_Lower_{period}': nan,
+                f'BB_Width_{period}': nan
+            }
+
+        # Identical values give exactly zero deviation
+        if self._same_run >= period:
+            self._mean = close
+            self._m2 = 0.0
+        elif self._m2 < 0.0:
+            self._m2 = 0.0
+        std = math.sqrt(self._m2 / (period - 1))
+        upper = self._mean + std * self.multiplier
+        lower = self._mean - std * self.multiplier
+        return {
+            f'BB_Middle_{period}': self._mean,
+            f'BB_Upper_{period}': upper,
+            f'BB_Lower_{period}': lower,
+            f'BB_Width_{period}': upper - lower
+        }
+
+
+class _WaveTrendState:
+    """Incremental HLC3 -> ESA -> D -> CI -> WT1 -> WT2 chain."""
+
+    def __init__(self, channel_length: int, average_length: int):
+        self._k1 = 2.0 / (channel_length + 1.0)
+        self._k2 = 2.0 / (average_length + 1.0)
+        self._esa = 0.0
+        self._d = 0.0
+        self._wt1 = deque(maxlen=4)
+
+    def update(self, tp: float):
+        """Add one typical price; returns (wt1, wt2, hist)."""
+        k1 = self._k1
+        first = not self._wt1
+        self._esa = tp if first else k1 * tp + (1.0 - k1) * self._esa
+        dev = tp - self._esa
+        self._d = 0.0 if first else k1 * abs(dev) + (1.0 - k1) * self._d
+        # Small epsilon avoids division by zero
+        ci = dev / (0.015 * self._d + 1e-10)
+        wt1 = ci if first else self._k2 * ci + (1.0 - self._k2) * self._wt1[-1]
+        self._wt1.append(wt1)
+
+        if len(self._wt1) < 4:
+            return wt1, math.nan, math.nan
+        w = self._wt1
+        wt2 = (w[0] + w[1] + w[2] + w[3]) / 4.0
+        return wt1, wt2, wt1 - wt2
+
+
+class StreamingCipherA:
+    """Market Cipher A wave trend (``MCA_WT1``, ``MCA_WT2``, ``MCA_Hist``)."""
+
+    def __init__(self, channel_length: int = 9, average_length: int = 12):
+        self._wave_trend = _WaveTrendState(channel_length, average_length)
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """
+        Add one bar.
+
+        Args:
+            high, low, close, volume (float): The new bar
+
+        Returns:
+            Dict[str, float]: Wave trend values; WT2 and Hist are NaN for
+                the first three bars
+        """
+        wt1, wt2, hist = self._wave_trend.update((high + low + close) / 3.0)
+        return {'MCA_WT1': wt1, 'MCA_WT2': wt2, 'MCA_Hist': hist}
+
+
+class StreamingCipherB:
+    """
+    Market Cipher B (``MCB_WT1/WT2/MFI/Hist/Buy/Sell``).
+
+    Money flow window sums are running totals over a ring buffer of the
+    last ``mfi_length`` flows; crossover dots compare the histogram sign
+    with the previous bar.
+    """
+
+    def __init__(
+        self,
+        channel_length: int = 9,
+        average_length: int = 12,
+        mfi_length: int = 60,
+        overbought: int = 53,
+        oversold: int = -53
+    ):
+        self.mfi_length = mfi_length
+        self.overbought = overbought
+        self.oversold = oversold
+        self._wave_trend = _WaveTrendState(channel_length, average_length)
+        # (direction, money flow) per bar; direction is 1, -1 or 0
+        self._flows = deque(maxlen=mfi_length)
+        self._prev_tp = None
+        self._prev_hist = math.nan
+        self._pos_sum = 0.0
+        self._neg_sum = 0.0
+        self._pos_count = 0
+        self._neg_count = 0
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """
+        Add one bar.
+
+        Args:
+            high, low, close, volume (float): The new bar
+
+        Returns:
+            Dict[str, float]: Market Cipher B values; MFI is NaN during
+                warm-up and Buy/Sell are 0 on bars without a signal
+        """
+        tp = (high + low + close) / 3.0
+        wt1, wt2, hist = self._wave_trend.update(tp)
+
+        full = len(self._flows) == self.mfi_length
+        leaving_direction, leaving_flow = self._flows[0] if full else (0, 0.0)
+
+        # Bar entering the money-flow window
+        direction = 0
+        flow = tp * volume
+        if self._prev_tp is not None:
+            if tp > self._prev_tp:
+                direction = 1
+                self._pos_sum += flow
+                self._pos_count += 1
+            elif tp < self._prev_tp:
+                direction = -1
+                self._neg_sum += flow
+                self._neg_count += 1
+        self._prev_tp = tp
+        self._flows.append((direction, flow))
+
+        # Bar leaving the window
+        if leaving_direction > 0:
+            self._pos_sum -= leaving_flow
+            self._pos_count -= 1
+        elif leaving_direction < 0:
+            self._neg_sum -= leaving_flow
+            self._neg_count -= 1
+        if self._pos_count == 0:
+            self._pos_sum = 0.0
+        if self._neg_count == 0:
+            self._neg_sum = 0.0
+
+        if len(self._flows) == self.mfi_length:
+            # Small epsilon avoids division by zero
+            value = 100.0 - 100.0 / (1.0 + self._pos_sum / (self._neg_sum + 1e-10))
+            mfi = (value - 50.0) * 2.0
+        else:
+            mfi = math.nan
+
+        # NaN comparisons are False, so no dots before WT2 exists
+        prev_hist = self._prev_hist
+        self._prev_hist = hist
+        buy = self.oversold if hist > 0.0 and prev_hist <= 0.0 and wt2 < self.oversold else 0
+        sell = self.overbought if hist < 0.0 and prev_hist >= 0.0 and wt2 > self.overbought else 0
+
+        return {
+            'MCB_WT1': wt1,
+            'MCB_WT2': wt2,
+            'MCB_MFI': mfi,
+            'MCB_Hist': hist,
+            'MCB_Buy': buy,
+            'MCB_Sell': sell
+        }
@@ -5,14 +5,32 @@ Generates interactive candlestick charts with Plotly, supporting multiple
 technical indicators, themes, time frame aggregation, and customization.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from typing import Dict, List, Optional, Any
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 from datetime import datetime
 
 from src.data_manager import DataManager
 from src.plugin_manager import PluginManager
+from plugins.base_indicator import BaseIndicator, PlotConfig
+from plugins.batch import compute_columns
+
+
+@lru_cache(maxsize=256)
+def _indicator_hovertemplate(name: str) -> str:
+    """Hover template for an indicator trace, built once per output name."""
+    return (
+        f'<b>{name}</b><br>'
+        '%{x|%Y-%m-%d}<br>'
+        'Value: %{y:.2f}<extra></extra>'
+    )
 
 
 class InteractiveChartEngine:
@@ -72,6 +90,32 @@ class InteractiveChartEngine:
         }
     }
     
+    # Read-only views of THEMES handed out by get_theme_config
+    _THEME_VIEWS = {name: MappingProxyType(config) for name, config in THEMES.items()}
+    
+    # Plotted series longer than this (after decimation) are drawn with WebGL
+    # traces instead of SVG. Undecimated series reach up to twice the chart
+    # width, so this stays below what the app's 400-2000 px widths allow
+    WEBGL_THRESHOLD = 1500
+    
+    # Range selector buttons on the price x-axis; plotly copies them on use
+    RANGE_SELECTOR_BUTTONS = (
+        dict(count=7, label="1w", step="day"),
+        dict(count=1, label="1m", step="month"),
+        dict(count=3, label="3m", step="month"),
+        dict(count=6, label="6m", step="month"),
+        dict(count=1, label="1y", step="year"),
+        dict(count=3, label="3y", step="year"),
+        dict(count=5, label="5y", step="year"),
+        dict(step="all", label="All")
+    )
+    
+    # Maximum number of (ticker, timeframe) frames kept by _get_aggregated
+    AGG_CACHE_SIZE = 64
+    
+    # Maximum number of indicator results kept by _add_indicators
+    INDICATOR_CACHE_SIZE = 256
+    
     def __init__(
         self,
         data_manager: DataManager,
@@ -101,6 +145,16 @@ class InteractiveChartEngine:
         self.theme = theme
         self.height = height
         self.width = width
+        # Aggregated OHLCV by (ticker, timeframe); entries are shared, so
+        # callers must not modify them in place
+        self._agg_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+        # Indicator output columns by (ticker, timeframe, chart_style,
+        # indicator, parameters), least recently used first
+        self._indicator_cache: OrderedDict[Tuple, Dict[str, np.ndarray]] = OrderedDict()
+        # Guards both caches: one engine serves every session thread
+        self._cache_lock = threading.Lock()
+        # Database version the caches were filled from, see sync_data_version
+        self._data_version: Any = None
     
     def change_theme(self, theme: str) -> None:
         """
@@ -117,14 +171,15 @@ class InteractiveChartEngine:
         
         self.theme = theme
     
-    def get_theme_config(self) -> Dict[str, str]:
+    def get_theme_config(self) -> Mapping[str, str]:
         """
         Get the current theme configuration.
         
         Returns:
-            Dict[str, str]: Theme configuration dictionary
+            Mapping[str, str]: Read-only theme configuration; use dict() on
+                it for a modifiable copy
         """
-        return self.THEMES[self.theme].copy()
+        return self._THEME_VIEWS[self.theme]
     
     def _calculate_heikin_ashi(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -142,34 +197,175 @@ class InteractiveChartEngine:
         Returns:
             pd.DataFrame: DataFrame with Heikin-Ashi OHLC values
         """
-        ha_df = df.copy()
+        open_ = df['open'].to_numpy(dtype=float)
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        close = df['close'].to_numpy(dtype=float)
         
         # Calculate HA Close
-        ha_df['ha_close'] = (df['open'] + df['high'] + df['low'] + df['close']) / 4
+        ha_close = (open_ + high + low + close) / 4
+        
+        # HA Open is a recurrence with weight 1/2 on the previous HA Close,
+        # i.e. an EMA (alpha=0.5) over the seed followed by shifted HA Close
+        ha_open_input = np.empty(len(df))
+        ha_open_input[:1] = (open_[:1] + close[:1]) / 2
+        ha_open_input[1:] = ha_close[:-1]
+        ha_open = pd.Series(ha_open_input).ewm(alpha=0.5, adjust=False).mean().to_numpy()
         
-        # Calculate HA Open (iteratively)
-        ha_df['ha_open'] = 0.0
-        ha_df.iloc[0, ha_df.columns.get_loc('ha_open')] = (df['open'].iloc[0] + df['close'].iloc[0]) / 2
+        # Replace original OHLC with HA values
+        ha_df = df.copy()
+        ha_df['open'] = ha_open
+        ha_df['high'] = np.fmax(high, np.fmax(ha_open, ha_close))
+        ha_df['low'] = np.fmin(low, np.fmin(ha_open, ha_close))
+        ha_df['close'] = ha_close
         
-        for i in range(1, len(ha_df)):
-            ha_df.iloc[i, ha_df.columns.get_loc('ha_open')] = (
-                ha_df['ha_open'].iloc[i-1] + ha_df['ha_close'].iloc[i-1]
-            ) / 2
+        return ha_df
+    
+    def _downsample_ohlc(self, df: pd.DataFrame, target_bins: int) -> pd.DataFrame:
+        """
+        Decimate an OHLCV dataframe into a fixed number of buckets.
         
-        # Calculate HA High and Low
-        ha_df['ha_high'] = ha_df[['high', 'ha_open', 'ha_close']].max(axis=1)
-        ha_df['ha_low'] = ha_df[['low', 'ha_open', 'ha_close']].min(axis=1)
+        Consecutive rows are grouped into ``target_bins`` equal-count buckets,
+        each reduced to first open, max high, min low, last close and summed
+        volume, so candle shapes survive the reduction. Any other columns
+        (e.g. indicator outputs) keep their last value in the bucket. Each
+        bucket is labelled with the date of its last row.
         
-        # Replace original OHLC with HA values
-        ha_df['open'] = ha_df['ha_open']
-        ha_df['high'] = ha_df['ha_high']
-        ha_df['low'] = ha_df['ha_low']
-        ha_df['close'] = ha_df['ha_close']
+        For very large series, switching the volume subplot to a WebGL trace
+        type (``scattergl``) further reduces browser rendering cost.
         
-        # Clean up temporary columns
-        ha_df = ha_df.drop(columns=['ha_open', 'ha_high', 'ha_low', 'ha_close'])
+        Args:
+            df (pd.DataFrame): OHLCV dataframe sorted by date
+            target_bins (int): Number of buckets to produce
         
-        return ha_df
+        Returns:
+            pd.DataFrame: Downsampled dataframe with at most target_bins rows
+        """
+        n = len(df)
+        if target_bins <= 0 or n <= target_bins:
+            return df
+        
+        buckets = np.arange(n) * target_bins // n
+        bucket_ends = np.append(np.flatnonzero(np.diff(buckets)), n - 1)
+        
+        agg_dict = {col: 'last' for col in df.columns}
+        agg_dict.update({
+            'open': 'first',
+            'high': 'max',
+            'low': 'min',
+            'close': 'last',
+            'volume': 'sum'
+        })
+        
+        df_agg = df.groupby(buckets).agg(agg_dict)
+        df_agg.index = df.index[bucket_ends]
+        
+        return df_agg
+    
+    def _decimation_bins(
+        self,
+        n_rows: int,
+        max_points: Optional[int],
+        width: int
+    ) -> Optional[int]:
+        """
+        Get the number of buckets a series is downsampled to for plotting.
+        
+        Args:
+            n_rows (int): Number of rows in the series
+            max_points (Optional[int]): Requested maximum number of bars
+            width (int): Chart width in pixels
+        
+        Returns:
+            Optional[int]: Target bucket count, or None if every row is plotted
+        """
+        if max_points is not None:
+            return max_points if 0 < max_points < n_rows else None
+        if n_rows > width * 2:
+            return width // 2
+        return None
+    
+    def _create_webgl_candlesticks(self, df: pd.DataFrame, name: str) -> List[Dict[str, Any]]:
+        """
+        Build candlesticks from WebGL traces for large series.
+        
+        Each direction (bullish/bearish) gets one wick trace of vertical
+        low-high segments and one body trace of filled rectangles, with
+        segments separated by gaps. OHLC values are attached to the wick
+        points as customdata for hover.
+        
+        Args:
+            df (pd.DataFrame): OHLCV dataframe
+            name (str): Legend name for the candlesticks
+        
+        Returns:
+            List[Dict[str, Any]]: Wick and body scattergl traces for both
+                directions
+        """
+        theme = self.THEMES[self.theme]
+        dates = df.index.to_numpy()
+        ohlc = df[['open', 'high', 'low', 'close']].to_numpy()
+        bullish = ohlc[:, 3] >= ohlc[:, 0]
+        
+        # Bodies span 70% of the typical spacing between candles
+        half_width = np.median(np.diff(dates)) * 0.35 if len(dates) > 1 else np.timedelta64(12, 'h')
+        
+        traces = []
+        for mask, color, showlegend in (
+            (bullish, theme['candle_bullish'], True),
+            (~bullish, theme['candle_bearish'], False)
+        ):
+            x, (o, h, l, c) = dates[mask], ohlc[mask].T
+            n = len(x)
+            if n == 0:
+                continue
+            
+            # Wicks: (x, low) -> (x, high) followed by a gap
+            wick_x = np.empty((n, 3), dtype=object)
+            wick_x[:, 0] = wick_x[:, 1] = x
+            wick_y = np.column_stack([l, h, np.full(n, np.nan)])
+            customdata = np.repeat(ohlc[mask], 3, axis=0)
+            
+            # Bodies: closed rectangle from open to close followed by a gap
+            left, right = x - half_width, x + half_width
+            body_x = np.empty((n, 6), dtype=object)
+            body_x[:, 0] = body_x[:, 3] = body_x[:, 4] = left
+            body_x[:, 1] = body_x[:, 2] = right
+            body_y = np.column_stack([o, o, c, c, o, np.full(n, np.nan)])
+            
+            traces.append(dict(
+                type='scattergl',
+                x=body_x.ravel(),
+                y=body_y.ravel(),
+                mode='lines',
+                fill='toself',
+                fillcolor=color,
+                line=dict(color=color, width=1),
+                name=name,
+                legendgroup=name,
+                showlegend=showlegend,
+                hoverinfo='skip'
+            ))
+            traces.append(dict(
+                type='scattergl',
+                x=wick_x.ravel(),
+                y=wick_y.ravel(),
+                mode='lines',
+                line=dict(color=color, width=1),
+                name=name,
+                legendgroup=name,
+                showlegend=False,
+                customdata=customdata,
+                hovertemplate=(
+                    '<b>%{x|%Y-%m-%d}</b><br>'
+                    'Open: $%{customdata[0]:.2f}<br>'
+                    'High: $%{customdata[1]:.2f}<br>'
+                    'Low: $%{customdata[2]:.2f}<br>'
+                    'Close: $%{customdata[3]:.2f}<extra></extra>'
+                )
+            ))
+        
+        return traces
     
     def create_candlestick_chart(
         self,
@@ -179,7 +375,10 @@ class InteractiveChartEngine:
         indicators: Optional[List[str]] = None,
         indicator_params: Optional[Dict[str, Dict]] = None,
         title: Optional[str] = None,
-        show_volume: bool = True
+        show_volume: bool = True,
+        max_points: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None
     ) -> go.Figure:
         """
         Create an interactive candlestick chart.
@@ -192,6 +391,13 @@ class InteractiveChartEngine:
             indicator_params (Optional[Dict[str, Dict]]): Parameters for indicators
             title (Optional[str]): Chart title. Default: auto-generated
             show_volume (bool): Show volume bars. Default: True
+            max_points (Optional[int]): Maximum number of bars to plot; longer
+                series are bucketed down to this many. Default: half the chart
+                width once the series exceeds twice the width
+            width (Optional[int]): Chart width in pixels. Default: the
+                engine's width
+            height (Optional[int]): Chart height in pixels. Default: the
+                engine's height
         
         Returns:
             go.Figure: Interactive Plotly figure
@@ -207,24 +413,46 @@ class InteractiveChartEngine:
         if chart_style not in ['candlestick', 'heikin_ashi', 'bars']:
             raise ValueError(f"Invalid chart_style: {chart_style}. Must be 'candlestick', 'heikin_ashi', or 'bars'")
         
+        # Look up plugins and apply their parameters before any work, so an
+        # unknown indicator or invalid parameter fails fast
+        plugins: Dict[str, Optional[BaseIndicator]] = {}
+        if indicators and self.plugin_manager:
+            plugins = self._get_plugins(indicators)
+            self._apply_parameters(plugins, indicator_params or {})
+        
+        # Resolve the theme and size once for every trace and axis below
+        theme = self.THEMES[self.theme]
+        if width is None:
+            width = self.width
+        if height is None:
+            height = self.height
+        
         # Get data
-        df = self.data_manager.get_ohlcv_data(ticker)
-        df = self.data_manager.aggregate_ohlcv(df, timeframe)
+        df = self._get_aggregated(ticker, timeframe)
         
         # Apply Heikin-Ashi transformation if selected
         if chart_style == 'heikin_ashi':
             df = self._calculate_heikin_ashi(df)
         
+        # Calculate indicators on the full series before any downsampling;
+        # plot configs are read after parameters are applied since output
+        # names depend on them
+        plot_configs: Dict[str, List[PlotConfig]] = {}
+        if plugins:
+            df = self._add_indicators(
+                df, plugins, source_key=(ticker, timeframe, chart_style)
+            )
+            plot_configs = {name: plugin.get_plot_configs() for name, plugin in plugins.items()}
+        
+        # Decimate series that have far more rows than the chart has pixels
+        target_bins = self._decimation_bins(len(df), max_points, width)
+        if target_bins is not None:
+            df = self._downsample_ohlc(df, target_bins)
+        
         # Check if any indicators need a separate subplot (y2 axis indicators like RSI)
-        has_separate_indicator = False
-        if indicators and self.plugin_manager:
-            for ind in indicators:
-                plugin = self.plugin_manager.get_plugin(ind)
-                if plugin:
-                    configs = plugin.get_plot_configs()
-                    if configs and configs[0].yaxis == 'y2':
-                        has_separate_indicator = True
-                        break
+        has_separate_indicator = any(
+            configs and configs[0].yaxis == 'y2' for configs in plot_configs.values()
+        )
         
         # Determine number of rows for subplots
         n_subplots = 1
@@ -243,29 +471,46 @@ class InteractiveChartEngine:
         else:
             row_heights = [1.0]
         
-        # Create subplots
-        fig = make_subplots(
-            rows=n_subplots,
-            cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.03,
-            row_heights=row_heights,
-            subplot_titles=[]
-        )
+        # Dates as an ndarray, shared by every trace: plotly validates a
+        # DatetimeIndex element by element, but takes datetime64 arrays as is
+        dates = df.index.to_numpy()
+        
+        if n_subplots == 1:
+            # A lone price chart needs no subplot grid; make_subplots costs
+            # an order of magnitude more than a plain figure
+            fig = go.Figure()
+            price_row = None
+        else:
+            # Create subplots
+            fig = make_subplots(
+                rows=n_subplots,
+                cols=1,
+                shared_xaxes=True,
+                vertical_spacing=0.03,
+                row_heights=row_heights,
+                subplot_titles=[]
+            )
+            price_row = 1
+        
+        # Traces and their subplot rows, added to the figure in one call;
+        # plain dicts are validated once there instead of also on construction
+        traces: List[Dict[str, Any]] = []
+        rows: List[Optional[int]] = []
         
         # Add price chart based on selected style
         if chart_style == 'bars':
             # OHLC Bar chart
-            fig.add_trace(
-                go.Ohlc(
-                    x=df.index,
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
+            traces.append(
+                dict(
+                    type='ohlc',
+                    x=dates,
+                    open=df['open'].to_numpy(),
+                    high=df['high'].to_numpy(),
+                    low=df['low'].to_numpy(),
+                    close=df['close'].to_numpy(),
                     name='OHLC',
-                    increasing_line_color=self.THEMES[self.theme]['candle_bullish'],
-                    decreasing_line_color=self.THEMES[self.theme]['candle_bearish'],
+                    increasing_line_color=theme['candle_bullish'],
+                    decreasing_line_color=theme['candle_bearish'],
                     hovertemplate=(
                         '<b>%{x|%Y-%m-%d}</b><br>'
                         'Open: $%{open:.2f}<br>'
@@ -273,23 +518,26 @@ class InteractiveChartEngine:
                         'Low: $%{low:.2f}<br>'
                         'Close: $%{close:.2f}<extra></extra>'
                     )
-                ),
-                row=1,
-                col=1
+                )
             )
+        elif len(df) > self.WEBGL_THRESHOLD:
+            # Large series: WebGL wick and body traces instead of SVG candles
+            chart_name = 'Heikin-Ashi' if chart_style == 'heikin_ashi' else 'OHLC'
+            traces.extend(self._create_webgl_candlesticks(df, chart_name))
         else:
             # Candlestick chart (regular or Heikin-Ashi)
             chart_name = 'Heikin-Ashi' if chart_style == 'heikin_ashi' else 'OHLC'
-            fig.add_trace(
-                go.Candlestick(
-                    x=df.index,
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
+            traces.append(
+                dict(
+                    type='candlestick',
+                    x=dates,
+                    open=df['open'].to_numpy(),
+                    high=df['high'].to_numpy(),
+                    low=df['low'].to_numpy(),
+                    close=df['close'].to_numpy(),
                     name=chart_name,
-                    increasing_line_color=self.THEMES[self.theme]['candle_bullish'],
-                    decreasing_line_color=self.THEMES[self.theme]['candle_bearish'],
+                    increasing_line_color=theme['candle_bullish'],
+                    decreasing_line_color=theme['candle_bearish'],
                     hovertemplate=(
                         '<b>%{x|%Y-%m-%d}</b><br>'
                         'Open: $%{open:.2f}<br>'
@@ -297,128 +545,88 @@ class InteractiveChartEngine:
                         'Low: $%{low:.2f}<br>'
                         'Close: $%{close:.2f}<extra></extra>'
                     )
-                ),
-                row=1,
-                col=1
+                )
             )
+        rows.extend([price_row] * len(traces))
         
         # Add volume bars
         if show_volume:
-            # Use darker colors for 'all' timeframe due to smaller bar widths in light mode
-            if timeframe == 'daily' and len(df) > 500:  # 'all' timeframe has many more data points
-                if self.theme == 'light':
-                    bullish_color = '#005522'  # Darker green for 'all' timeframe
-                    bearish_color = '#aa0000'  # Darker red for 'all' timeframe
-                else:
-                    bullish_color = self.THEMES[self.theme]['volume_bullish']
-                    bearish_color = self.THEMES[self.theme]['volume_bearish']
-            else:
-                bullish_color = self.THEMES[self.theme]['volume_bullish']
-                bearish_color = self.THEMES[self.theme]['volume_bearish']
+            bullish_color, bearish_color = self._volume_colors(
+                self.theme, timeframe, len(df)
+            )
             
-            colors = [
-                bullish_color
-                if close >= open_ 
-                else bearish_color
-                for close, open_ in zip(df['close'], df['open'])
-            ]
+            # One vectorized comparison instead of a per-row Python loop
+            colors = np.where(
+                df['close'].to_numpy() >= df['open'].to_numpy(),
+                bullish_color,
+                bearish_color
+            )
             
-            fig.add_trace(
-                go.Bar(
-                    x=df.index,
-                    y=df['volume'],
+            traces.append(
+                dict(
+                    type='bar',
+                    x=dates,
+                    y=df['volume'].to_numpy(),
                     name='Volume',
                     marker_color=colors,
                     showlegend=False,
                     hovertemplate='<b>%{x|%Y-%m-%d}</b><br>Volume: %{y:,.0f}<extra></extra>'
-                ),
-                row=2,
-                col=1
+                )
             )
+            rows.append(2)
         
         # Add technical indicators
         if indicators and self.plugin_manager:
-            df_with_indicators = self._add_indicators(
-                df, indicators, indicator_params or {}
-            )
+            # Determine which row to use for separate indicators (y2);
+            # None places traces on a figure without a subplot grid
+            indicator_row = n_subplots if has_separate_indicator else price_row
             
-            # Determine which row to use for separate indicators (y2)
-            indicator_row = n_subplots if has_separate_indicator else 1
-            
-            # Add indicator traces - pass both price row and indicator row
-            self._add_indicator_traces(
-                fig, df_with_indicators, indicators, 
-                price_row=1, 
-                indicator_row=indicator_row,
-                show_volume=show_volume
-            )
-        
-        # Update layout
-        self._update_layout(fig, ticker, timeframe, title)
+            # Indicator traces - pass both price row and indicator row
+            for trace, row in self._indicator_traces(
+                df, plot_configs,
+                price_row=price_row,
+                indicator_row=indicator_row
+            ):
+                traces.append(trace)
+                rows.append(row)
         
-        # Update x-axis with styled range selector buttons
-        theme = self.THEMES[self.theme]
-        fig.update_xaxes(
-            rangeslider_visible=False,
-            rangeselector=dict(
-                buttons=list([
-                    dict(count=7, label="1w", step="day"),
-                    dict(count=1, label="1m", step="month"),
-                    dict(count=3, label="3m", step="month"),
-                    dict(count=6, label="6m", step="month"),
-                    dict(count=1, label="1y", step="year"),
-                    dict(count=3, label="3y", step="year"),
-                    dict(count=5, label="5y", step="year"),
-                    dict(step="all", label="All")
-                ]),
-                bgcolor='rgba(200, 200, 200, 0.3)' if self.theme == 'light' else 'rgba(100, 100, 100, 0.3)',
-                activecolor='rgba(100, 150, 200, 0.5)' if self.theme == 'light' else 'rgba(100, 150, 200, 0.7)',
-                font=dict(
-                    color=theme['font_color'],
-                    size=12
-                )
-            ),
-            row=1,
-            col=1
-        )
+        # One validation and subplot mapping pass for every trace
+        if price_row is None:
+            fig.add_traces(traces)
+        else:
+            fig.add_traces(traces, rows=rows, cols=1)
         
-        # Update y-axes
-        fig.update_yaxes(
-            title_text="Price ($)",
+        # Per-axis styling, applied together with the layout in one update
+        axis_style = dict(
             title_font=dict(color=theme['axis_color'], size=12),
             tickfont=dict(color=theme['axis_color'], size=10),
             showgrid=True,
             gridwidth=1,
-            gridcolor=theme['grid_color'],
-            row=1,
-            col=1
+            gridcolor=theme['grid_color']
         )
+        axes = {
+            # Price x-axis with styled range selector buttons
+            'xaxis': dict(
+                rangeslider_visible=False,
+                rangeselector=dict(
+                    buttons=self.RANGE_SELECTOR_BUTTONS,
+                    bgcolor='rgba(200, 200, 200, 0.3)' if self.theme == 'light' else 'rgba(100, 100, 100, 0.3)',
+                    activecolor='rgba(100, 150, 200, 0.5)' if self.theme == 'light' else 'rgba(100, 150, 200, 0.7)',
+                    font=dict(
+                        color=theme['font_color'],
+                        size=12
+                    )
+                )
+            ),
+            'yaxis': dict(axis_style, title_text="Price ($)")
+        }
         
+        # Volume row
         if show_volume:
-            fig.update_yaxes(
-                title_text="Volume",
-                title_font=dict(color=theme['axis_color'], size=12),
-                tickfont=dict(color=theme['axis_color'], size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor=theme['grid_color'],
-                row=2,
-                col=1
-            )
-        
-        # Update x-axis for volume row with matching colors
-        if show_volume:
-            fig.update_xaxes(
-                title_font=dict(color=theme['axis_color'], size=12),
-                tickfont=dict(color=theme['axis_color'], size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor=theme['grid_color'],
-                row=2,
-                col=1
-            )
+            axes['xaxis2'] = dict(axis_style)
+            axes['yaxis2'] = dict(axis_style, title_text="Volume")
         
-        # Update y-axis for indicator row (RSI, Market Cipher, etc.) if it exists
+        # Indicator row (RSI, Market Cipher, etc.) if it exists
         if has_separate_indicator:
             indicator_row_num = n_subplots  # Last row is the indicator row
             
@@ -426,70 +634,378 @@ class InteractiveChartEngine:
             indicator_title = "Indicator"
             indicator_range = [0, 100]  # Default RSI range
             
-            if indicators and self.plugin_manager:
-                for ind in indicators:
-                    plugin = self.plugin_manager.get_plugin(ind)
-                    if plugin:
-                        configs = plugin.get_plot_configs()
-                        if configs and configs[0].yaxis == 'y2':
-                            indicator_title = plugin.name
-                            # Market Cipher uses -100 to 100 range
-                            if 'Market Cipher' in plugin.name or 'MCA' in plugin.name or 'MCB' in plugin.name:
-                                indicator_range = [-100, 100]
-                            break
+            for ind, configs in plot_configs.items():
+                if configs and configs[0].yaxis == 'y2':
+                    plugin = plugins[ind]
+                    indicator_title = plugin.name
+                    # Market Cipher uses -100 to 100 range
+                    if 'Market Cipher' in plugin.name or 'MCA' in plugin.name or 'MCB' in plugin.name:
+                        indicator_range = [-100, 100]
+                    break
             
-            fig.update_yaxes(
-                title_text=indicator_title,
-                title_font=dict(color=theme['axis_color'], size=12),
-                tickfont=dict(color=theme['axis_color'], size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor=theme['grid_color'],
-                range=indicator_range,
-                row=indicator_row_num,
-                col=1
+            axes[f'xaxis{indicator_row_num}'] = dict(axis_style)
+            axes[f'yaxis{indicator_row_num}'] = dict(
+                axis_style, title_text=indicator_title, range=indicator_range
             )
-            fig.update_xaxes(
-                title_font=dict(color=theme['axis_color'], size=12),
-                tickfont=dict(color=theme['axis_color'], size=10),
-                showgrid=True,
-                gridwidth=1,
-                gridcolor=theme['grid_color'],
-                row=indicator_row_num,
-                col=1
+        
+        # Update layout and every axis with a single call; the build settings
+        # let append_bar extend or rebuild the figure later
+        build = dict(
+            ticker=ticker,
+            chart_style=chart_style,
+            indicators=list(indicators or []),
+            indicator_params=indicator_params or {},
+            title=title,
+            show_volume=show_volume,
+            max_points=max_points
+        )
+        self._update_layout(fig, ticker, timeframe, title, width, height, axes, build)
+        
+        return fig
+    
+    def _volume_colors(self, theme_name: str, timeframe: str, n_bars: int) -> Tuple[str, str]:
+        """
+        Get the bullish and bearish volume bar colors.
+        
+        Args:
+            theme_name (str): 'light' or 'dark'
+            timeframe (str): Time frame of the chart
+            n_bars (int): Number of plotted bars
+        
+        Returns:
+            Tuple[str, str]: (bullish_color, bearish_color)
+        """
+        # Use darker colors for 'all' timeframe due to smaller bar widths in light mode
+        if timeframe == 'daily' and n_bars > 500 and theme_name == 'light':
+            return '#005522', '#aa0000'
+        theme = self.THEMES[theme_name]
+        return theme['volume_bullish'], theme['volume_bearish']
+    
+    def apply_theme_to_figure(self, fig: go.Figure, theme: str) -> go.Figure:
+        """
+        Restyle a figure from create_candlestick_chart for another theme.
+        
+        Only colors are updated, so a theme toggle skips data loading,
+        indicator calculation and trace construction. The result matches
+        building the chart with the new theme.
+        
+        Args:
+            fig (go.Figure): Figure created by create_candlestick_chart
+            theme (str): New theme ('light' or 'dark')
+        
+        Returns:
+            go.Figure: The same figure, updated in place
+        
+        Raises:
+            ValueError: If theme is invalid or fig was not built by this engine
+        """
+        if theme not in self.THEMES:
+            raise ValueError(f"Invalid theme: {theme}. Must be 'light' or 'dark'")
+        
+        meta = fig.layout.meta
+        if not isinstance(meta, dict) or meta.get('theme') not in self.THEMES:
+            raise ValueError("Figure was not created by create_candlestick_chart")
+        old_name = meta['theme']
+        if old_name == theme:
+            return fig
+        
+        old, new = self.THEMES[old_name], self.THEMES[theme]
+        light = theme == 'light'
+        
+        fig.update_layout(
+            meta=dict(meta, theme=theme),
+            title_font_color=new['font_color'],
+            plot_bgcolor=new['bg_color'],
+            paper_bgcolor=new['paper_color'],
+            font_color=new['font_color'],
+            legend=dict(
+                bgcolor='rgba(255, 255, 255, 0.8)' if light else 'rgba(30, 30, 30, 0.9)',
+                bordercolor=new['grid_color'],
+                font_color=new['font_color']
+            )
+        )
+        axis_colors = dict(
+            gridcolor=new['grid_color'],
+            title_font_color=new['axis_color'],
+            tickfont_color=new['axis_color']
+        )
+        fig.update_xaxes(**axis_colors)
+        fig.update_yaxes(**axis_colors)
+        # The range selector lives on the price x-axis, which is always 'xaxis'
+        fig.update_layout(
+            xaxis_rangeselector=dict(
+                bgcolor='rgba(200, 200, 200, 0.3)' if light else 'rgba(100, 100, 100, 0.3)',
+                activecolor='rgba(100, 150, 200, 0.5)' if light else 'rgba(100, 150, 200, 0.7)',
+                font_color=new['font_color']
+            )
+        )
+        
+        # Price traces: SVG candles/bars and WebGL candle wicks and bodies
+        candle_colors = {
+            old['candle_bullish']: new['candle_bullish'],
+            old['candle_bearish']: new['candle_bearish']
+        }
+        fig.update_traces(
+            increasing_line_color=new['candle_bullish'],
+            decreasing_line_color=new['candle_bearish'],
+            selector=lambda trace: trace.type in ('candlestick', 'ohlc')
+        )
+        for trace in fig.select_traces(
+            selector=lambda trace: trace.type == 'scattergl'
+            and trace.legendgroup in ('OHLC', 'Heikin-Ashi')
+        ):
+            color = candle_colors[trace.line.color]
+            trace.line.color = color
+            if trace.fill == 'toself':
+                trace.fillcolor = color
+        
+        # Volume bars keep their direction, in the new palette
+        for trace in fig.select_traces(selector=dict(type='bar', name='Volume')):
+            colors = np.asarray(trace.marker.color)
+            old_bullish, _ = self._volume_colors(old_name, meta['timeframe'], len(colors))
+            trace.marker.color = np.where(
+                colors == old_bullish,
+                *self._volume_colors(theme, meta['timeframe'], len(colors))
             )
         
         return fig
     
-    def _add_indicators(
-        self,
-        df: pd.DataFrame,
-        indicators: List[str],
-        params: Dict[str, Dict]
-    ) -> pd.DataFrame:
+    def append_bar(self, fig: go.Figure, bar: pd.Series) -> go.Figure:
         """
-        Add technical indicators to the dataframe.
+        Add a new daily bar to a figure from create_candlestick_chart.
+        
+        The bar is appended to the memoized daily data of the figure's
+        ticker, so later charts include it without reloading the database
+        (storing it there is still up to the caller). Daily charts that plot
+        every bar as SVG candles or OHLC bars are extended in place: the
+        price and volume traces get the new bar and each indicator trace its
+        latest value, without re-aggregating or rebuilding any trace. Other
+        charts (weekly/monthly, downsampled or WebGL candles) are rebuilt
+        with their original settings.
         
         Args:
-            df (pd.DataFrame): OHLCV dataframe
-            indicators (List[str]): List of indicator names
-            params (Dict[str, Dict]): Indicator parameters
+            fig (go.Figure): Figure created by create_candlestick_chart
+            bar (pd.Series): 'open', 'high', 'low', 'close' and 'volume' of
+                the new bar, named with its date
         
         Returns:
-            pd.DataFrame: DataFrame with indicator columns added
+            go.Figure: fig updated in place, or a rebuilt figure
         
         Raises:
-            ValueError: If indicator calculation fails
-            KeyError: If indicator not found
+            ValueError: If fig was not built by this engine or the bar is not
+                newer than the last stored bar
         """
-        df_with_indicators = df.copy()
+        meta = fig.layout.meta
+        if not isinstance(meta, dict) or 'ticker' not in meta:
+            raise ValueError("Figure was not created by create_candlestick_chart")
+        ticker, timeframe = meta['ticker'], meta['timeframe']
+        chart_style, indicators = meta['chart_style'], meta['indicators']
         
-        for indicator_name in indicators:
-            if not self.plugin_manager:
-                continue
+        daily = self._get_aggregated(ticker, 'daily')
+        date = pd.Timestamp(bar.name)
+        if len(daily) and date <= daily.index[-1]:
+            raise ValueError(
+                f"Bar date {date.date()} is not after the last bar ({daily.index[-1].date()})"
+            )
+        
+        index = pd.DatetimeIndex([date], name=daily.index.name).astype(daily.index.dtype)
+        row = pd.DataFrame([bar[daily.columns]], index=index).astype(daily.dtypes.to_dict())
+        updated = pd.concat([daily, row])
+        
+        # Coarser timeframes and indicator results of the ticker are now stale
+        with self._cache_lock:
+            self._drop_ticker(ticker)
+            self._agg_cache[(ticker, 'daily')] = updated
+        
+        # In place only while the new bar maps to exactly one new point in
+        # unchanged trace types
+        n_old, n_new = len(daily), len(updated)
+        in_place = (
+            timeframe == 'daily'
+            and self._decimation_bins(n_new, meta['max_points'], fig.layout.width) is None
+            and (chart_style == 'bars' or n_new <= self.WEBGL_THRESHOLD)
+            and (n_old > self.WEBGL_THRESHOLD) == (n_new > self.WEBGL_THRESHOLD)
+        )
+        
+        if in_place:
+            df = updated
+            if chart_style == 'heikin_ashi':
+                df = self._calculate_heikin_ashi(df)
+            columns = []
+            if indicators and self.plugin_manager:
+                # Full-series recompute: the compiled kernels take
+                # milliseconds, and the result is memoized for the next build
+                plugins = self._get_plugins(indicators)
+                self._apply_parameters(plugins, meta['indicator_params'])
+                df = self._add_indicators(
+                    df, plugins, source_key=(ticker, timeframe, chart_style)
+                )
+                columns = self._indicator_columns(df, {
+                    name: plugin.get_plot_configs() for name, plugin in plugins.items()
+                })
+            
+            # An indicator that just left its warm-up has no trace yet
+            traces = {trace.name: trace for trace in fig.data}
+            in_place = all(config.name in traces for config, _ in columns)
+        
+        if not in_place:
+            rebuilt = self.create_candlestick_chart(
+                ticker,
+                timeframe,
+                chart_style,
+                indicators=indicators or None,
+                indicator_params=meta['indicator_params'],
+                title=meta['title'],
+                show_volume=meta['show_volume'],
+                max_points=meta['max_points'],
+                width=fig.layout.width,
+                height=fig.layout.height
+            )
+            return self.apply_theme_to_figure(rebuilt, meta['theme'])
+        
+        def extend(values, column: str) -> np.ndarray:
+            """Return trace values with the last value of a df column added."""
+            values = np.asarray(values)
+            return np.concatenate((values, df[column].to_numpy(dtype=values.dtype)[-1:]))
+        
+        date_tail = df.index[-1:].to_numpy()
+        with fig.batch_update():
+            for trace in fig.select_traces(
+                selector=lambda trace: trace.type in ('candlestick', 'ohlc')
+            ):
+                trace.x = np.concatenate((trace.x, date_tail))
+                trace.open = extend(trace.open, 'open')
+                trace.high = extend(trace.high, 'high')
+                trace.low = extend(trace.low, 'low')
+                trace.close = extend(trace.close, 'close')
             
-            indicator = self.plugin_manager.get_plugin(indicator_name)
+            for trace in fig.select_traces(selector=dict(type='bar', name='Volume')):
+                trace.x = np.concatenate((trace.x, date_tail))
+                trace.y = extend(trace.y, 'volume')
+                # The palette depends on the bar count, so recolor every bar
+                trace.marker.color = np.where(
+                    df['close'].to_numpy() >= df['open'].to_numpy(),
+                    *self._volume_colors(meta['theme'], timeframe, n_new)
+                )
             
+            for config, column_name in columns:
+                trace = traces[config.name]
+                trace.x = np.concatenate((trace.x, date_tail))
+                trace.y = extend(trace.y, column_name)
+        
+        return fig
+    
+    def _get_aggregated(self, ticker: str, timeframe: str) -> pd.DataFrame:
+        """
+        Get OHLCV data for a ticker aggregated to a timeframe, memoized.
+        
+        Args:
+            ticker (str): Stock ticker symbol
+            timeframe (str): 'daily', 'weekly', or 'monthly'
+        
+        Returns:
+            pd.DataFrame: Aggregated OHLCV data (shared; do not modify in place)
+        """
+        key = (ticker, timeframe)
+        with self._cache_lock:
+            df = self._agg_cache.get(key)
+            daily = self._agg_cache.get((ticker, 'daily'))
+        if df is not None:
+            return df
+        
+        # Loaded outside the lock; concurrent misses may both load, and the
+        # last one stored wins
+        if timeframe != 'daily' and daily is not None:
+            # Reduce the memoized daily frame, which also carries any bars
+            # added by append_bar
+            df = self.data_manager.aggregate_ohlcv(daily, timeframe)
+        else:
+            # Weekly/monthly bars are reduced inside the database
+            df = self.data_manager.get_ohlcv_aggregated(ticker, timeframe)
+        with self._cache_lock:
+            if key not in self._agg_cache and len(self._agg_cache) >= self.AGG_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._agg_cache[next(iter(self._agg_cache))]
+            self._agg_cache[key] = df
+        return df
+    
+    def invalidate_cache(self, ticker: Optional[str] = None) -> None:
+        """
+        Drop memoized data after the underlying database has been updated.
+        
+        Args:
+            ticker (Optional[str]): Only drop this ticker's frames. Default: all
+        """
+        with self._cache_lock:
+            if ticker is None:
+                self._agg_cache.clear()
+                self._indicator_cache.clear()
+            else:
+                self._drop_ticker(ticker)
+        self.data_manager.clear_cache()
+    
+    def sync_data_version(self, version: Any) -> bool:
+        """
+        Drop memoized data if the database changed since the last call.
+        
+        Args:
+            version (Any): Value that changes whenever the database is
+                written, such as its modification time
+        
+        Returns:
+            bool: True if memoized data was dropped
+        """
+        with self._cache_lock:
+            if version == self._data_version:
+                return False
+            self._data_version = version
+        self.invalidate_cache()
+        return True
+    
+    def _drop_ticker(self, ticker: str) -> None:
+        """
+        Drop a ticker's memoized frames and indicator results.
+        
+        The caller must hold _cache_lock.
+        
+        Args:
+            ticker (str): Stock ticker symbol
+        """
+        for cache in (self._agg_cache, self._indicator_cache):
+            for key in [key for key in cache if key[0] == ticker]:
+                del cache[key]
+    
+    def _get_plugins(self, indicators: List[str]) -> Dict[str, Optional[BaseIndicator]]:
+        """
+        Look up the plugin of each indicator once for a render.
+        
+        Args:
+            indicators (List[str]): List of indicator names
+        
+        Returns:
+            Dict[str, Optional[BaseIndicator]]: Plugin by indicator name, in
+                the given order; None for unknown names
+        """
+        return {name: self.plugin_manager.get_plugin(name) for name in indicators}
+    
+    def _apply_parameters(
+        self,
+        plugins: Dict[str, Optional[BaseIndicator]],
+        params: Dict[str, Dict]
+    ) -> None:
+        """
+        Set the parameters of each indicator for a render.
+        
+        Args:
+            plugins (Dict[str, Optional[BaseIndicator]]): Plugins by indicator
+                name, from _get_plugins
+            params (Dict[str, Dict]): Indicator parameters
+        
+        Raises:
+            ValueError: If parameters are invalid
+            KeyError: If indicator not found
+        """
+        for indicator_name, indicator in plugins.items():
             if indicator is None:
                 raise KeyError(f"Indicator not found: {indicator_name}")
             
@@ -500,115 +1016,212 @@ class InteractiveChartEngine:
                     raise ValueError(
                         f"Invalid parameters for {indicator_name}: {errors}"
                     )
+    
+    def _add_indicators(
+        self,
+        df: pd.DataFrame,
+        plugins: Dict[str, BaseIndicator],
+        source_key: Optional[Tuple[str, str, str]] = None
+    ) -> pd.DataFrame:
+        """
+        Add technical indicators to the dataframe.
+        
+        Args:
+            df (pd.DataFrame): OHLCV dataframe
+            plugins (Dict[str, BaseIndicator]): Plugins by indicator name,
+                with parameters set by _apply_parameters
+            source_key (Optional[Tuple[str, str, str]]): (ticker, timeframe,
+                chart_style) that df was built from; results are memoized
+                under it. Default: no memoization
+        
+        Returns:
+            pd.DataFrame: DataFrame with indicator columns added
+        
+        Raises:
+            ValueError: If indicator calculation fails
+        """
+        if not self.plugin_manager:
+            return df
+        
+        outputs: List[Optional[Dict[str, np.ndarray]]] = []
+        missing = []
+        for indicator_name, indicator in plugins.items():
+            # Key on the effective parameters, since plugin instances (and
+            # their parameters) are shared between calls
+            key = None
+            if source_key is not None:
+                key = source_key + (
+                    indicator_name, tuple(sorted(indicator.get_parameters().items()))
+                )
             
-            # Calculate indicator
-            try:
-                df_with_indicators = indicator.calculate(df_with_indicators)
-            except Exception as e:
-                raise ValueError(f"Error calculating {indicator_name}: {e}")
+            cached = None
+            if key is not None:
+                with self._cache_lock:
+                    cached = self._indicator_cache.get(key)
+                    if cached is not None:
+                        self._indicator_cache.move_to_end(key)
+            if cached is None:
+                missing.append((len(outputs), key, indicator))
+            outputs.append(cached)
+        
+        # One OHLCV extraction for all indicators that are not cached
+        computed = compute_columns(df, [indicator for _, _, indicator in missing])
+        for (position, key, _), columns in zip(missing, computed):
+            outputs[position] = columns
+            if key is not None:
+                with self._cache_lock:
+                    self._indicator_cache[key] = columns
+                    self._indicator_cache.move_to_end(key)
+                    while len(self._indicator_cache) > self.INDICATOR_CACHE_SIZE:
+                        self._indicator_cache.popitem(last=False)
         
-        return df_with_indicators
+        # Attach all indicator columns with a single assign
+        results: Dict[str, np.ndarray] = {}
+        for columns in outputs:
+            results.update(columns)
+        return df.assign(**results) if results else df
     
-    def _add_indicator_traces(
+    def _indicator_columns(
         self,
-        fig: go.Figure,
         df: pd.DataFrame,
-        indicators: List[str],
-        price_row: int = 1,
-        indicator_row: int = 1,
-        show_volume: bool = True
-    ) -> None:
+        plot_configs: Dict[str, List[PlotConfig]]
+    ) -> List[Tuple[PlotConfig, str]]:
         """
-        Add indicator traces to the figure.
+        Match indicator plot configurations to their plottable columns.
         
         Args:
-            fig (go.Figure): Plotly figure
             df (pd.DataFrame): DataFrame with calculated indicators
-            indicators (List[str]): List of indicator names
-            price_row (int): Row number for price-based indicators (y axis)
-            indicator_row (int): Row number for separate indicators (y2 axis)
-            show_volume (bool): Whether volume is displayed
+            plot_configs (Dict[str, List[PlotConfig]]): Plot configurations
+                by indicator name
+        
+        Returns:
+            List[Tuple[PlotConfig, str]]: (plot config, column name) pairs in
+                plotting order; configs without a column holding any values
+                are left out
         """
-        for indicator_name in indicators:
-            if not self.plugin_manager:
-                continue
-            
-            indicator = self.plugin_manager.get_plugin(indicator_name)
-            
-            if indicator is None:
-                continue
-            
-            # Get plot configurations
-            plot_configs = indicator.get_plot_configs()
-            
-            for config in plot_configs:
-                # Find the column in dataframe
-                column_name = None
-                for col in df.columns:
-                    if col.startswith(config.name.split('(')[0]) or col == config.name:
-                        column_name = col
-                        break
+        # Columns sorted by name, so the columns starting with a prefix are
+        # adjacent and each lookup is a bisect instead of a scan of df.columns
+        sorted_columns = sorted((col, position) for position, col in enumerate(df.columns))
+        sorted_names = [col for col, _ in sorted_columns]
+        
+        def find_column(prefix: str) -> Optional[str]:
+            """Return the first column (in df order) starting with prefix."""
+            best = None
+            i = bisect_left(sorted_names, prefix)
+            while i < len(sorted_names) and sorted_names[i].startswith(prefix):
+                if best is None or sorted_columns[i][1] < best[1]:
+                    best = sorted_columns[i]
+                i += 1
+            return best[0] if best else None
+        
+        matches = []
+        for configs in plot_configs.values():
+            for config in configs:
+                # Find the column in dataframe ("SMA(20)" matches "SMA_20");
+                # config.name itself always starts with its own prefix
+                column_name = find_column(config.name.split('(')[0])
                 
-                if column_name is None or df[column_name].isna().all():
+                if column_name is None:
                     continue
                 
-                # Determine which row to use based on y-axis
-                if config.yaxis == 'y2':
-                    # Separate indicators (like RSI) go to their own row
-                    target_row = indicator_row
-                else:
-                    # Price-based indicators (like SMA, Bollinger) go on price chart
-                    target_row = price_row
-                
-                # Add trace based on type
-                if config.type == 'line':
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df.index,
-                            y=df[column_name],
-                            name=config.name,
-                            mode='lines',
-                            line=dict(
-                                color=config.color,
-                                width=config.line_width,
-                                dash=config.line_dash
-                            ),
-                            opacity=config.opacity,
-                            hovertemplate=(
-                                f'<b>{config.name}</b><br>'
-                                '%{x|%Y-%m-%d}<br>'
-                                'Value: %{y:.2f}<extra></extra>'
-                            )
-                        ),
-                        row=target_row,
-                        col=1
-                    )
+                # Warm-up NaNs come first, so a valid last value settles it
+                # without scanning the column
+                column = df[column_name]
+                if column.empty or (pd.isna(column.iloc[-1]) and column.isna().all()):
+                    continue
                 
-                elif config.type == 'bar':
-                    fig.add_trace(
-                        go.Bar(
-                            x=df.index,
-                            y=df[column_name],
-                            name=config.name,
-                            marker_color=config.color,
-                            opacity=config.opacity,
-                            showlegend=config.showlegend,
-                            hovertemplate=(
-                                f'<b>{config.name}</b><br>'
-                                '%{x|%Y-%m-%d}<br>'
-                                'Value: %{y:.2f}<extra></extra>'
-                            )
+                matches.append((config, column_name))
+        
+        return matches
+    
+    def _indicator_traces(
+        self,
+        df: pd.DataFrame,
+        plot_configs: Dict[str, List[PlotConfig]],
+        price_row: Optional[int] = 1,
+        indicator_row: Optional[int] = 1
+    ) -> List[Tuple[Dict[str, Any], Optional[int]]]:
+        """
+        Build the indicator traces of a figure.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with calculated indicators
+            plot_configs (Dict[str, List[PlotConfig]]): Plot configurations
+                by indicator name
+            price_row (Optional[int]): Row number for price-based indicators
+                (y axis), or None for a figure without subplots
+            indicator_row (Optional[int]): Row number for separate indicators
+                (y2 axis), or None for a figure without subplots
+        
+        Returns:
+            List[Tuple[Dict[str, Any], Optional[int]]]: (trace, row) pairs
+                in plotting order
+        """
+        # Large series: WebGL lines, matching the WebGL candlestick traces
+        scatter = 'scattergl' if len(df) > self.WEBGL_THRESHOLD else 'scatter'
+        dates = df.index.to_numpy()
+        
+        traces = []
+        for config, column_name in self._indicator_columns(df, plot_configs):
+            # Determine which row to use based on y-axis
+            if config.yaxis == 'y2':
+                # Separate indicators (like RSI) go to their own row
+                target_row = indicator_row
+            else:
+                # Price-based indicators (like SMA, Bollinger) go on price chart
+                target_row = price_row
+            
+            # Single precision is far finer than a pixel or the 2-decimal
+            # hover text, and halves the serialized array
+            values = df[column_name].to_numpy(dtype=np.float32)
+            
+            # Add trace based on type
+            if config.type == 'line':
+                traces.append((
+                    dict(
+                        type=scatter,
+                        x=dates,
+                        y=values,
+                        name=config.name,
+                        mode='lines',
+                        line=dict(
+                            color=config.color,
+                            width=config.line_width,
+                            dash=config.line_dash
                         ),
-                        row=target_row,
-                        col=1
-                    )
+                        opacity=config.opacity,
+                        hovertemplate=_indicator_hovertemplate(config.name)
+                    ),
+                    target_row
+                ))
+            
+            elif config.type == 'bar':
+                traces.append((
+                    dict(
+                        type='bar',
+                        x=dates,
+                        y=values,
+                        name=config.name,
+                        marker_color=config.color,
+                        opacity=config.opacity,
+                        showlegend=config.showlegend,
+                        hovertemplate=_indicator_hovertemplate(config.name)
+                    ),
+                    target_row
+                ))
+        
+        return traces
     
     def _update_layout(
         self,
         fig: go.Figure,
         ticker: str,
         timeframe: str,
-        title: Optional[str]
+        title: Optional[str],
+        width: int,
+        height: int,
+        axes: Optional[Dict[str, Dict]] = None,
+        build: Optional[Dict[str, Any]] = None
     ) -> None:
         """
         Update the figure layout with theme and styling.
@@ -618,13 +1231,20 @@ class InteractiveChartEngine:
             ticker (str): Stock ticker
             timeframe (str): Time frame name
             title (Optional[str]): Custom title
+            width (int): Figure width in pixels
+            height (int): Figure height in pixels
+            axes (Optional[Dict[str, Dict]]): Extra per-axis properties keyed
+                by layout axis name ('xaxis', 'yaxis2', ...), merged into the
+                same update
+            build (Optional[Dict[str, Any]]): Chart settings recorded in
+                layout.meta alongside the theme and timeframe
         """
         theme = self.THEMES[self.theme]
         
         if title is None:
             title = f"{ticker} - {timeframe.capitalize()} Candlestick Chart"
         
-        fig.update_layout(
+        layout = dict(
             title=dict(
                 text=title,
                 x=0.5,
@@ -634,9 +1254,11 @@ class InteractiveChartEngine:
             xaxis_title="Date",
             yaxis_title="Price ($)",
             template="plotly",
+            # Lets apply_theme_to_figure and append_bar update the figure later
+            meta=dict(theme=self.theme, timeframe=timeframe, **(build or {})),
             hovermode='x unified',
-            height=self.height,
-            width=self.width,
+            height=height,
+            width=width,
             plot_bgcolor=theme['bg_color'],
             paper_bgcolor=theme['paper_color'],
             font=dict(color=theme['font_color'], family="Arial, sans-serif"),
@@ -667,6 +1289,10 @@ class InteractiveChartEngine:
                 font=dict(color=theme['font_color'])
             )
         )
+        for name, properties in (axes or {}).items():
+            layout[name] = {**layout.get(name, {}), **properties}
+        
+        fig.update_layout(**layout)
     
     def get_available_indicators(self) -> List[str]:
         """
@@ -6,11 +6,91 @@ for the interactive charting application.
 """
 
 import sqlite3
+import threading
+import time
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from src.ohlc_kernels import aggregate_periods, ohlc_flags
+
+
+# Per-connection read tuning: memory-map up to 1 GB of the file and allow a
+# ~200 MB page cache (negative cache_size is in KiB)
+CONNECTION_PRAGMAS = """
+PRAGMA mmap_size = 1073741824;
+PRAGMA cache_size = -200000;
+"""
+
+# Query text is kept constant so sqlite3's statement cache reuses prepared statements
+TICKERS_QUERY = "SELECT DISTINCT ticker FROM ohlc_data ORDER BY ticker"
+
+OHLCV_QUERY = """
+SELECT date, open, high, low, close, volume
+FROM ohlc_data
+WHERE ticker = ?
+ORDER BY date ASC
+"""
+
+# Per timeframe: a cheap per-row grouping key and the period label computed
+# once per group, matching aggregate_ohlcv. Weeks run Saturday to Friday
+# (W-FRI): the Julian day number is 0 on Mondays, so +2 puts Saturdays on a
+# multiple of 7. Months end on their last day.
+PERIODS = {
+    'weekly': (
+        "(CAST(julianday(date) + 0.5 AS INTEGER) + 2) / 7",
+        "date(p.first_date, 'weekday 5')"
+    ),
+    'monthly': (
+        "substr(date, 1, 7)",
+        "date(p.first_date, 'start of month', '+1 month', '-1 day')"
+    )
+}
+
+# Reduce each period in SQLite; open and close are primary-key lookups of the
+# first/last row with a price. Periods without prices drop out like the
+# dropna() in aggregate_ohlcv
+AGGREGATED_OHLCV_QUERY = """
+WITH periods AS (
+    SELECT {key} AS period,
+           MIN(date) AS first_date,
+           MIN(CASE WHEN open IS NOT NULL THEN date END) AS open_date,
+           MAX(CASE WHEN close IS NOT NULL THEN date END) AS close_date,
+           MAX(high) AS high,
+           MIN(low) AS low,
+           COALESCE(SUM(volume), 0) AS volume,
+           COUNT(*) - COUNT(volume) AS missing_volume
+    FROM ohlc_data
+    WHERE ticker = :ticker
+    GROUP BY period
+)
+SELECT {label} AS date, o.open, p.high, p.low, c.close, p.volume,
+       p.missing_volume
+FROM periods p
+JOIN ohlc_data o ON o.ticker = :ticker AND o.date = p.open_date
+JOIN ohlc_data c ON c.ticker = :ticker AND c.date = p.close_date
+WHERE p.high IS NOT NULL AND p.low IS NOT NULL
+ORDER BY p.period ASC
+"""
+
+# SQLite answers a lone MIN() or MAX() with one index seek, but scans every
+# row of the ticker when both share a SELECT, so each gets its own subquery
+DATE_RANGE_QUERY = """
+SELECT (SELECT MIN(date) FROM ohlc_data WHERE ticker = ?1),
+       (SELECT MAX(date) FROM ohlc_data WHERE ticker = ?1)
+"""
+
+TICKER_INFO_QUERY = """
+SELECT MIN(date), MAX(date), COUNT(*),
+       (SELECT close FROM ohlc_data
+        WHERE ticker = ? ORDER BY date DESC LIMIT 1),
+       MAX(high), MIN(low), AVG(volume)
+FROM ohlc_data
+WHERE ticker = ?
+"""
 
 class DataManager:
     """
@@ -18,12 +98,14 @@ class DataManager:
     and time scale aggregation.
     """
     
-    def __init__(self, db_path: str = "market_data.db"):
+    def __init__(self, db_path: str = "market_data.db", max_cache_entries: int = 64):
         """
         Initialize the DataManager.
         
         Args:
             db_path (str): Path to the SQLite database file
+            max_cache_entries (int): Maximum number of tickers kept in the
+                OHLCV cache; least recently used ones are evicted. Default: 64
         
         Raises:
             FileNotFoundError: If database file doesn't exist
@@ -33,8 +115,50 @@ class DataManager:
         if not Path(db_path).exists():
             raise FileNotFoundError(f"Database file not found: {db_path}")
         
-        self._cache = {}
+        # LRU cache of (load time, frame) entries, oldest first
+        self._cache: OrderedDict = OrderedDict()
         self._cache_ttl = 3600  # Cache TTL in seconds
+        self._max_cache_entries = max_cache_entries
+        self._cache_lock = threading.Lock()
+        
+        # One persistent connection per thread, opened on first use
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's database connection.
+        
+        Connections are kept open between queries, so repeated reads skip
+        opening the file and rebuilding SQLite's page cache and statement
+        cache.
+        
+        Returns:
+            sqlite3.Connection: Connection in autocommit mode
+        
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # check_same_thread=False lets close() run from any thread
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            conn.executescript(CONNECTION_PRAGMAS)
+            with self._connections_lock:
+                self._connections.append(conn)
+            self._local.conn = conn
+        return conn
+    
+    def close(self) -> None:
+        """Close every database connection opened by this DataManager."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
     
     def get_available_tickers(self) -> List[str]:
         """
@@ -44,14 +168,12 @@ class DataManager:
             List[str]: List of ticker symbols
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._connection().cursor()
             
             # Get distinct tickers from market_data table
-            cursor.execute("SELECT DISTINCT ticker FROM ohlc_data ORDER BY ticker")
+            cursor.execute(TICKERS_QUERY)
             tickers = [row[0] for row in cursor.fetchall()]
             
-            conn.close()
             return tickers
         
         except sqlite3.Error as e:
@@ -65,48 +187,176 @@ class DataManager:
             ticker (str): Ticker symbol
         
         Returns:
-            pd.DataFrame: DataFrame with columns [date, open, high, low, close, volume]
+            pd.DataFrame: DataFrame with columns [date, open, high, low, close, volume].
+                It shares its data with the cache: under pandas copy-on-write
+                (the default from pandas 3) writes copy first, otherwise do
+                not modify it in place
         
         Raises:
             ValueError: If ticker not found
             RuntimeError: If database error occurs
         """
         cache_key = f"ohlcv_{ticker}"
-        if cache_key in self._cache:
-            return self._cache[cache_key].copy()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            query = """
-            SELECT date, open, high, low, close, volume
-            FROM ohlc_data
-            WHERE ticker = ?
-            ORDER BY date ASC
-            """
+            df = self._read_ohlcv(OHLCV_QUERY, (ticker,))
             
-            df = pd.read_sql_query(
-                query,
-                conn,
-                params=(ticker,),
-                parse_dates=['date']
-            )
+            if df.empty:
+                raise ValueError(f"No data found for ticker: {ticker}")
             
-            conn.close()
+            return self._cache_put(cache_key, df)
+        
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Database error: {e}")
+    
+    def get_ohlcv_aggregated(self, ticker: str, timeframe: str) -> pd.DataFrame:
+        """
+        Retrieve OHLCV data for a ticker aggregated to a timeframe.
+        
+        Weekly and monthly bars are reduced inside SQLite, so only one row
+        per period is transferred instead of every daily row; a daily frame
+        that is already cached is reduced in memory instead. The result
+        matches ``aggregate_ohlcv(get_ohlcv_data(ticker), timeframe)``.
+        
+        Args:
+            ticker (str): Ticker symbol
+            timeframe (str): 'daily', 'weekly', or 'monthly'
+        
+        Returns:
+            pd.DataFrame: Aggregated OHLCV DataFrame, shared with the cache
+                like get_ohlcv_data
+        
+        Raises:
+            ValueError: If ticker not found or invalid timeframe specified
+            RuntimeError: If database error occurs
+        """
+        timeframe = timeframe.lower()
+        if timeframe == 'daily':
+            return self.get_ohlcv_data(ticker)
+        
+        if timeframe not in PERIODS:
+            raise ValueError(f"Invalid timeframe: {timeframe}. "
+                           "Must be 'daily', 'weekly', or 'monthly'")
+        
+        cache_key = f"ohlcv_{ticker}_{timeframe}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        daily = self._cache_get(f"ohlcv_{ticker}")
+        if daily is not None:
+            return self._cache_put(cache_key, self.aggregate_ohlcv(daily, timeframe))
+        
+        try:
+            key, label = PERIODS[timeframe]
+            df = self._read_ohlcv(
+                AGGREGATED_OHLCV_QUERY.format(key=key, label=label),
+                {'ticker': ticker}
+            )
             
             if df.empty:
                 raise ValueError(f"No data found for ticker: {ticker}")
             
-            # Set date as index
-            df.set_index('date', inplace=True)
-            
-            # Cache the result
-            self._cache[cache_key] = df.copy()
+            # NULL volumes make the daily column float; keep the same dtype
+            if df.pop('missing_volume').any():
+                df['volume'] = df['volume'].astype(float)
             
-            return df
+            return self._cache_put(cache_key, df)
         
         except sqlite3.Error as e:
             raise RuntimeError(f"Database error: {e}")
     
+    def _read_ohlcv(self, query: str, params) -> pd.DataFrame:
+        """
+        Run a query returning a 'date' column and numeric columns.
+        
+        Columns are built straight from the fetched rows with NumPy instead
+        of going through pd.read_sql_query's generic conversion. NULLs
+        become NaN, turning integer columns into float like pandas does.
+        
+        Args:
+            query (str): SQL query
+            params: Query parameters
+        
+        Returns:
+            pd.DataFrame: Rows indexed by date (datetime64[us])
+        
+        Raises:
+            sqlite3.Error: If the query fails
+        """
+        cursor = self._connection().execute(query, params)
+        names = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+        
+        columns = dict(zip(names, zip(*rows))) if rows else {name: () for name in names}
+        dates = columns.pop('date')
+        
+        data = {}
+        for name, values in columns.items():
+            array = np.array(values)
+            if array.dtype == object:
+                # NULLs leave an object array; None converts to NaN
+                array = array.astype(np.float64)
+            data[name] = array
+        
+        # NumPy parses plain 'YYYY-MM-DD' text (the schema's format) straight
+        # to days, which scale to microseconds with one multiply; anything
+        # longer may carry a time or zone, which only pandas keeps
+        try:
+            plain = max(map(len, dates), default=0) <= 10
+        except TypeError:
+            plain = False
+        if plain:
+            days = np.array(dates, dtype='datetime64[D]').view(np.int64)
+            index = (days * 86_400_000_000).view('datetime64[us]')
+        else:
+            index = pd.to_datetime(list(dates)).as_unit('us')
+        
+        return pd.DataFrame(data, index=pd.DatetimeIndex(index, name='date'))
+    
+    def _cache_get(self, cache_key: str) -> Optional[pd.DataFrame]:
+        """
+        Look up a cached frame, dropping it once it is older than the TTL.
+        
+        Args:
+            cache_key (str): Cache key
+        
+        Returns:
+            Optional[pd.DataFrame]: Shallow copy of the cached frame, or None
+        """
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            loaded_at, df = entry
+            if time.monotonic() - loaded_at > self._cache_ttl:
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+        # Shallow copy: a new frame without copying the column data
+        return df.copy(deep=False)
+    
+    def _cache_put(self, cache_key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cache a frame, evicting the least recently used entries.
+        
+        Args:
+            cache_key (str): Cache key
+            df (pd.DataFrame): Frame to cache; not copied
+        
+        Returns:
+            pd.DataFrame: Shallow copy of df for the caller
+        """
+        with self._cache_lock:
+            self._cache[cache_key] = (time.monotonic(), df)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._max_cache_entries:
+                self._cache.popitem(last=False)
+        return df.copy(deep=False)
+    
     def aggregate_ohlcv(
         self,
         df: pd.DataFrame,
@@ -120,48 +370,79 @@ class DataManager:
             timeframe (str): 'daily', 'weekly', or 'monthly'
         
         Returns:
-            pd.DataFrame: Aggregated OHLCV DataFrame
+            pd.DataFrame: Aggregated OHLCV DataFrame; for 'daily', a frame
+                sharing df's data
         
         Raises:
             ValueError: If invalid timeframe specified
         """
-        if timeframe.lower() == 'daily':
-            return df.copy()
+        timeframe = timeframe.lower()
+        if timeframe == 'daily':
+            return df.copy(deep=False)
         
-        df_copy = df.copy()
-        
-        if timeframe.lower() == 'weekly':
+        if timeframe == 'weekly':
             # Aggregate to weeks (Friday close)
-            agg_dict = {
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }
-            
-            df_agg = df_copy.resample('W-FRI').agg(agg_dict)
+            labels = self._week_end_labels(df.index)
         
-        elif timeframe.lower() == 'monthly':
+        elif timeframe == 'monthly':
             # Aggregate to months (last day of month)
-            agg_dict = {
-                'open': 'first',
-                'high': 'max',
-                'low': 'min',
-                'close': 'last',
-                'volume': 'sum'
-            }
-            
-            df_agg = df_copy.resample('M').agg(agg_dict)
+            labels = self._month_end_labels(df.index)
         
         else:
             raise ValueError(f"Invalid timeframe: {timeframe}. "
                            "Must be 'daily', 'weekly', or 'monthly'")
         
-        # Remove rows with NaN values from aggregation
-        df_agg = df_agg.dropna()
+        return self._aggregate_by_labels(df, labels)
+    
+    @staticmethod
+    def _week_end_labels(index: pd.DatetimeIndex) -> np.ndarray:
+        """Map each date to the Friday that closes its week (W-FRI)."""
+        days = index.to_numpy().astype('datetime64[D]')
+        # Day 0 of the epoch (1970-01-01) was a Thursday, i.e. weekday 3
+        weekday = (days.astype(np.int64) + 3) % 7
+        return days + (4 - weekday) % 7
+    
+    @staticmethod
+    def _month_end_labels(index: pd.DatetimeIndex) -> np.ndarray:
+        """Map each date to the last day of its month."""
+        months = index.to_numpy().astype('datetime64[M]')
+        return (months + 1).astype('datetime64[D]') - 1
+    
+    @staticmethod
+    def _aggregate_by_labels(df: pd.DataFrame, labels: np.ndarray) -> pd.DataFrame:
+        """
+        Reduce consecutive rows sharing a period label to one OHLCV bar.
+        
+        Runs as one compiled pass over the column arrays (see
+        ``src.ohlc_kernels.aggregate_periods``) instead of going through
+        pandas' resampler. NaN handling matches ``resample().agg().dropna()``:
+        open and close take the first/last non-NaN value, high/low ignore NaN,
+        volume sums NaN as zero, and periods left without a price are dropped.
         
-        return df_agg
+        Args:
+            df (pd.DataFrame): OHLCV DataFrame sorted by date
+            labels (np.ndarray): Period label (datetime64[D]) for each row
+        
+        Returns:
+            pd.DataFrame: One row per period with complete prices, indexed
+                by period label
+        """
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        
+        if len(df) == 0:
+            return df[columns].iloc[:0]
+        
+        period_labels, *values = aggregate_periods(
+            labels.view(np.int64),
+            *(df[col].to_numpy(dtype=float) for col in columns[:4]),
+            df['volume'].to_numpy()
+        )
+        
+        index = pd.DatetimeIndex(
+            period_labels.view('datetime64[D]').astype(df.index.dtype),
+            name=df.index.name
+        )
+        return pd.DataFrame(dict(zip(columns, values)), index=index)
     
     def get_date_range(self, ticker: str) -> Tuple[datetime, datetime]:
         """
@@ -178,16 +459,11 @@ class DataManager:
             RuntimeError: If database error occurs
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._connection().cursor()
             
-            cursor.execute(
-                "SELECT MIN(date), MAX(date) FROM ohlc_data WHERE ticker = ?",
-                (ticker,)
-            )
+            cursor.execute(DATE_RANGE_QUERY, (ticker,))
             
             result = cursor.fetchone()
-            conn.close()
             
             if result[0] is None:
                 raise ValueError(f"No data found for ticker: {ticker}")
@@ -214,26 +490,43 @@ class DataManager:
             ValueError: If ticker not found
         """
         try:
-            df = self.get_ohlcv_data(ticker)
-            start_date, end_date = self.get_date_range(ticker)
+            cursor = self._connection().cursor()
+            
+            # Compute every metric in one aggregate pass over the ticker's rows
+            cursor.execute(TICKER_INFO_QUERY, (ticker, ticker))
+            
+            result = cursor.fetchone()
+            
+            if result[0] is None:
+                raise ValueError(f"No data found for ticker: {ticker}")
+            
+            start_date, end_date, count, *metrics = result
+            # Price and volume columns are nullable; report missing values as NaN
+            close, high, low, volume = (
+                float(value) if value is not None else float('nan')
+                for value in metrics
+            )
             
             return {
                 'ticker': ticker,
-                'start_date': start_date,
-                'end_date': end_date,
-                'record_count': len(df),
-                'current_price': float(df['close'].iloc[-1]),
-                'highest_price': float(df['high'].max()),
-                'lowest_price': float(df['low'].min()),
-                'average_volume': float(df['volume'].mean())
+                'start_date': datetime.fromisoformat(start_date),
+                'end_date': datetime.fromisoformat(end_date),
+                'record_count': count,
+                'current_price': close,
+                'highest_price': high,
+                'lowest_price': low,
+                'average_volume': volume
             }
         
-        except (ValueError, RuntimeError) as e:
+        except sqlite3.Error as e:
+            raise ValueError(f"Error getting info for {ticker}: Database error: {e}")
+        except ValueError as e:
             raise ValueError(f"Error getting info for {ticker}: {e}")
     
     def clear_cache(self) -> None:
         """Clear all cached data."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
     
     def validate_data(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
@@ -256,8 +549,26 @@ class DataManager:
         if missing_cols:
             errors.append(f"Missing columns: {missing_cols}")
         
+        price_cols = ['open', 'high', 'low', 'close']
+        dtypes = df.dtypes
+        if all(
+            col in dtypes.index and pd.api.types.is_numeric_dtype(dtypes[col])
+            for col in price_cols
+        ):
+            # NaN and high >= low checks in one compiled pass
+            *nan_flags, inverted = ohlc_flags(*(
+                df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                for col in price_cols
+            ))
+            for col, has_nan in zip(price_cols, nan_flags):
+                if has_nan:
+                    errors.append(f"Column '{col}' contains NaN values")
+            if inverted:
+                errors.append("High < Low in some rows")
+            return (len(errors) == 0, errors)
+        
         # Check for NaN in OHLC columns
-        for col in ['open', 'high', 'low', 'close']:
+        for col in price_cols:
             if col in df.columns and df[col].isna().any():
                 errors.append(f"Column '{col}' contains NaN values")
         
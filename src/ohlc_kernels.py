@@ -0,0 +1,124 @@
+"""
+Compiled OHLCV Kernels
+
+Single-pass loops used by the data layer to validate and aggregate OHLCV
+columns. When numba is installed they are JIT-compiled; otherwise they run
+as plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def ohlc_flags(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+    """
+    Check OHLC columns for NaNs and inverted bars in one pass.
+
+    Stops scanning as soon as every check has failed.
+
+    Args:
+        open_, high, low, close (np.ndarray): Price columns (float64)
+
+    Returns:
+        Tuple of bools: (open has NaN, high has NaN, low has NaN,
+            close has NaN, some high < low)
+    """
+    nan_open = False
+    nan_high = False
+    nan_low = False
+    nan_close = False
+    inverted = False
+    for i in range(open_.shape[0]):
+        h = high[i]
+        lo = low[i]
+        # NaN is the only value not equal to itself
+        if open_[i] != open_[i]:
+            nan_open = True
+        if h != h:
+            nan_high = True
+        if lo != lo:
+            nan_low = True
+        if close[i] != close[i]:
+            nan_close = True
+        if h < lo:
+            inverted = True
+        if nan_open and nan_high and nan_low and nan_close and inverted:
+            break
+    return nan_open, nan_high, nan_low, nan_close, inverted
+
+
+@njit(cache=True, nogil=True)
+def aggregate_periods(labels: np.ndarray, open_: np.ndarray, high: np.ndarray,
+                      low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+    """
+    Reduce runs of rows sharing a period label to OHLCV bars in one pass.
+
+    Matches ``resample().agg().dropna()``: open and close take the first and
+    last non-NaN value, high and low ignore NaN, volume sums NaN as zero,
+    and periods without a complete set of prices are dropped.
+
+    Args:
+        labels (np.ndarray): Period label of each row (int64, sorted)
+        open_, high, low, close (np.ndarray): Price columns (float64)
+        volume (np.ndarray): Volume column (int64 or float64)
+
+    Returns:
+        Tuple of np.ndarray: (labels, open, high, low, close, volume), one
+            entry per complete period; volume keeps its input dtype
+    """
+    n = labels.shape[0]
+    out_labels = np.empty(n, dtype=labels.dtype)
+    out_open = np.empty(n, dtype=np.float64)
+    out_high = np.empty(n, dtype=np.float64)
+    out_low = np.empty(n, dtype=np.float64)
+    out_close = np.empty(n, dtype=np.float64)
+    out_volume = np.empty(n, dtype=volume.dtype)
+
+    count = 0
+    i = 0
+    while i < n:
+        label = labels[i]
+        o = np.nan
+        h = np.nan
+        lo = np.nan
+        c = np.nan
+        out_volume[count] = 0
+        # NaN is the only value not equal to itself, and fails every
+        # comparison, so an unset high/low is replaced by the first number
+        while i < n and labels[i] == label:
+            value = open_[i]
+            if o != o:
+                o = value
+            value = high[i]
+            if value == value and not value <= h:
+                h = value
+            value = low[i]
+            if value == value and not value >= lo:
+                lo = value
+            value = close[i]
+            if value == value:
+                c = value
+            value = volume[i]
+            if value == value:
+                out_volume[count] += value
+            i += 1
+
+        if o == o and h == h and lo == lo and c == c:
+            out_labels[count] = label
+            out_open[count] = o
+            out_high[count] = h
+            out_low[count] = lo
+            out_close[count] = c
+            count += 1
+
+    return (out_labels[:count], out_open[:count], out_high[:count],
+            out_low[:count], out_close[:count], out_volume[:count])
@@ -5,15 +5,52 @@ Handles discovery, loading, validation, and management of technical indicator
 plugins from the plugins/indicators directory.
 """
 
+import ast
 import importlib
 import importlib.util
+import logging
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple, Any
 from abc import ABC
 
 from plugins.base_indicator import BaseIndicator
 
+logger = logging.getLogger(__name__)
+
+
+# Plugin modules are registered in sys.modules under this prefix, so a
+# plugin file cannot shadow or be shadowed by a real top-level module
+PLUGIN_MODULE_PREFIX = "_mdm_plugin_"
+
+# Class attributes and methods every plugin must provide
+_REQUIRED_ATTRS = ('name', 'version', 'description', 'author')
+_REQUIRED_METHODS = ('_define_parameters', 'calculate', 'get_plot_configs')
+_MISSING = object()
+
+
+def _defines_class(module_path: Path) -> bool:
+    """
+    Check without executing a module whether it defines any class.
+    
+    Whether a class is a BaseIndicator subclass can only be told by running
+    the module (bases may be imported or aliased), so only class-free
+    helper modules are ruled out.
+    
+    Args:
+        module_path (Path): Path of the module file
+    
+    Returns:
+        bool: True if the module contains a class statement
+    
+    Raises:
+        SyntaxError: If the module cannot be parsed
+    """
+    tree = ast.parse(Path(module_path).read_bytes(), filename=str(module_path))
+    return any(isinstance(node, ast.ClassDef) for node in ast.walk(tree))
+
 
 class PluginManager:
     """
@@ -54,83 +91,126 @@ class PluginManager:
         self.loaded_plugins: Dict[str, type] = {}
         self.plugin_instances: Dict[str, BaseIndicator] = {}
         self.plugin_metadata: Dict[str, Dict] = {}
-        self._plugin_module_map: Dict[str, str] = {}  # Maps plugin name to module name
+        # (st_mtime_ns, st_size) of each loaded module file, to skip unchanged
+        # modules on reload
+        self._plugin_fingerprints: Dict[str, Tuple[int, int]] = {}
+        # (directory mtime_ns, discovered modules) from the last directory scan
+        self._discovery_cache: Optional[Tuple[int, Dict[str, Path]]] = None
     
     def discover_plugins(self) -> Dict[str, Path]:
         """
         Discover all Python files in the plugins directory.
         
+        The directory is read with a single scandir pass, and the result is
+        reused until the directory's modification time changes (adding,
+        removing or renaming a file updates it).
+        
         Returns:
             Dict[str, Path]: Dictionary of module names to file paths
         """
         plugins = {}
         
         try:
-            for py_file in self.plugins_dir.glob("*.py"):
-                # Skip __init__.py and private modules
-                if py_file.name.startswith("_"):
-                    continue
-                
-                module_name = py_file.stem
-                plugins[module_name] = py_file
+            mtime_ns = os.stat(self.plugins_dir).st_mtime_ns
+            if self._discovery_cache is not None and self._discovery_cache[0] == mtime_ns:
+                return dict(self._discovery_cache[1])
+            
+            with os.scandir(self.plugins_dir) as entries:
+                for entry in entries:
+                    # Skip __init__.py, private modules and non-Python files
+                    name = entry.name
+                    if name.startswith("_") or not name.endswith(".py"):
+                        continue
+                    
+                    plugins[name[:-3]] = Path(entry.path)
+            
+            self._discovery_cache = (mtime_ns, dict(plugins))
         
         except Exception as e:
-            print(f"Error discovering plugins: {e}")
+            logger.error(f"Error discovering plugins: {e}")
         
         return plugins
     
-    def load_plugin(self, module_name: str) -> Tuple[bool, Optional[str]]:
+    def load_plugin(
+        self,
+        module_name: str,
+        module_path: Optional[Path] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Load a single plugin module.
         
+        A module that is already loaded and whose file has the same
+        modification time and size as when it was loaded is not executed
+        again.
+        
         Args:
             module_name (str): Name of the module to load (without .py extension)
+            module_path (Optional[Path]): File found by discover_plugins.
+                Default: looked up in the plugins directory
         
         Returns:
             Tuple[bool, Optional[str]]: (success, error_message)
         """
         try:
-            module_path = self.plugins_dir / f"{module_name}.py"
+            if module_path is None:
+                module_path = self.plugins_dir / f"{module_name}.py"
             
-            if not module_path.exists():
+            # One stat both checks the file and fingerprints it
+            try:
+                stat = os.stat(module_path)
+            except FileNotFoundError:
                 return (False, f"Module file not found: {module_path}")
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            
+            if (self._plugin_fingerprints.get(module_name) == fingerprint
+                    and module_name in self._loaded_modules()):
+                return (True, None)
+            
+            # Drop what an earlier version of the module registered, so
+            # renamed or removed classes do not linger
+            self._unload_module(module_name)
+            
+            # Helper modules without any class are never executed
+            if not _defines_class(module_path):
+                return (False, f"No valid BaseIndicator subclasses found in {module_name}")
             
             # Create module spec and load the module
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
+            qualified_name = PLUGIN_MODULE_PREFIX + module_name
+            spec = importlib.util.spec_from_file_location(qualified_name, module_path)
             
             if spec is None or spec.loader is None:
                 return (False, f"Failed to create spec for {module_name}")
             
             module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
+            sys.modules[qualified_name] = module
             spec.loader.exec_module(module)
             
-            # Find all BaseIndicator subclasses in the module
+            # Find all BaseIndicator subclasses in the module's own namespace;
+            # no dir() sort or getattr per name
             loaded_classes = []
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
+            for attr_name, attr in list(vars(module).items()):
+                if attr_name.startswith('_'):
+                    continue
                 
                 # Check if it's a class and a BaseIndicator subclass (but not BaseIndicator itself)
                 if (isinstance(attr, type) and 
-                    issubclass(attr, BaseIndicator) and 
                     attr is not BaseIndicator and
+                    issubclass(attr, BaseIndicator) and 
                     attr.__module__ == module.__name__):
                     
                     try:
-                        # Validate the plugin
-                        is_valid, error = self._validate_plugin(attr)
+                        # Validate the plugin, keeping the instance it creates
+                        is_valid, error, instance = self._validate_plugin(attr)
                         
                         if not is_valid:
-                            print(f"Warning: Plugin {attr_name} validation failed: {error}")
+                            logger.warning(f"Plugin {attr_name} validation failed: {error}")
                             continue
                         
                         # Store the plugin
                         plugin_name = attr.name
                         self.loaded_plugins[plugin_name] = attr
-                        self._plugin_module_map[plugin_name] = module_name
                         
-                        # Create instance and extract metadata
-                        instance = attr()
+                        # Store the instance and extract metadata
                         self.plugin_instances[plugin_name] = instance
                         self.plugin_metadata[plugin_name] = instance.get_metadata()
                         
@@ -142,6 +222,7 @@ class PluginManager:
             if not loaded_classes:
                 return (False, f"No valid BaseIndicator subclasses found in {module_name}")
             
+            self._plugin_fingerprints[module_name] = fingerprint
             return (True, None)
         
         except Exception as e:
@@ -158,14 +239,16 @@ class PluginManager:
         results = {}
         plugins = self.discover_plugins()
         
-        for module_name in plugins:
-            success, error = self.load_plugin(module_name)
+        for module_name, module_path in plugins.items():
+            success, error = self.load_plugin(module_name, module_path)
             results[module_name] = (success, error)
             
-            if success:
-                print(f"✓ Loaded plugin: {module_name}")
-            else:
-                print(f"✗ Failed to load plugin {module_name}: {error}")
+            if not success:
+                logger.error(f"Failed to load plugin {module_name}: {error}")
+        
+        # One summary line instead of a line per plugin
+        loaded = [module_name for module_name, (success, _) in results.items() if success]
+        logger.info(f"Loaded {len(loaded)}/{len(results)} plugin modules: {', '.join(loaded)}")
         
         return results
     
@@ -173,21 +256,68 @@ class PluginManager:
         """
         Reload all plugins.
         
-        Clears existing plugins and reloads from disk. Useful for development.
+        Re-executes only modules whose file changed since it was loaded and
+        drops the plugins of modules whose file is gone; plugins of
+        unchanged modules keep their instances. Useful for development.
         
         Returns:
             Dict[str, Tuple[bool, Optional[str]]]: Results for each module
         """
-        # Clear existing plugins
-        self.loaded_plugins.clear()
-        self.plugin_instances.clear()
-        self.plugin_metadata.clear()
-        self._plugin_module_map.clear()
+        discovered = self.discover_plugins()
+        for module_name in self._loaded_modules() - set(discovered):
+            self._unload_module(module_name)
         
-        # Reload all plugins
+        # Reload changed plugins
         return self.load_all_plugins()
     
-    def _validate_plugin(self, plugin_class: type) -> Tuple[bool, Optional[str]]:
+    def _unload_module(self, module_name: str) -> None:
+        """
+        Remove every plugin registered by a module, and the module itself
+        from sys.modules.
+        
+        Args:
+            module_name (str): Name of the module (without .py extension)
+        """
+        for plugin_name in [
+            name for name in self.loaded_plugins if self._plugin_module(name) == module_name
+        ]:
+            del self.loaded_plugins[plugin_name]
+            self.plugin_instances.pop(plugin_name, None)
+            self.plugin_metadata.pop(plugin_name, None)
+        self._plugin_fingerprints.pop(module_name, None)
+        sys.modules.pop(PLUGIN_MODULE_PREFIX + module_name, None)
+    
+    def _plugin_module(self, plugin_name: str) -> Optional[str]:
+        """
+        Get the module a loaded plugin class was defined in.
+        
+        Args:
+            plugin_name (str): Name of a loaded plugin
+        
+        Returns:
+            Optional[str]: Module name (without .py extension), or None if
+                the class was not loaded from the plugins directory
+        """
+        module = self.loaded_plugins[plugin_name].__module__
+        if not module.startswith(PLUGIN_MODULE_PREFIX):
+            return None
+        return module[len(PLUGIN_MODULE_PREFIX):]
+    
+    def _loaded_modules(self) -> Set[str]:
+        """
+        Get the modules that currently have at least one loaded plugin.
+        
+        Returns:
+            Set[str]: Module names (without .py extension)
+        """
+        modules = {self._plugin_module(name) for name in self.loaded_plugins}
+        modules.discard(None)
+        return modules
+    
+    def _validate_plugin(
+        self,
+        plugin_class: type
+    ) -> Tuple[bool, Optional[str], Optional[BaseIndicator]]:
         """
         Validate a plugin class.
         
@@ -195,21 +325,19 @@ class PluginManager:
             plugin_class (type): The plugin class to validate
         
         Returns:
-            Tuple[bool, Optional[str]]: (is_valid, error_message)
+            Tuple[bool, Optional[str], Optional[BaseIndicator]]: (is_valid,
+                error_message, instance); the instance created for the checks
+                is returned for reuse when the plugin is valid
         """
-        # Check required class attributes
-        required_attrs = ['name', 'version', 'description', 'author']
-        
-        for attr in required_attrs:
-            if not hasattr(plugin_class, attr) or not getattr(plugin_class, attr):
-                return (False, f"Missing or empty '{attr}' attribute")
+        # Check required class attributes (one lookup each; missing reads as empty)
+        for attr in _REQUIRED_ATTRS:
+            if not getattr(plugin_class, attr, None):
+                return (False, f"Missing or empty '{attr}' attribute", None)
         
         # Check required methods
-        required_methods = ['_define_parameters', 'calculate', 'get_plot_configs']
-        
-        for method in required_methods:
-            if not hasattr(plugin_class, method):
-                return (False, f"Missing required method '{method}'")
+        for method in _REQUIRED_METHODS:
+            if getattr(plugin_class, method, _MISSING) is _MISSING:
+                return (False, f"Missing required method '{method}'", None)
         
         # Try to instantiate and validate
         try:
@@ -217,17 +345,17 @@ class PluginManager:
             
             # Check that parameters are valid
             if not isinstance(instance.parameters, dict):
-                return (False, "Parameters must be a dictionary")
+                return (False, "Parameters must be a dictionary", None)
             
             # Check that plot configs are valid
             configs = instance.get_plot_configs()
             if not isinstance(configs, list):
-                return (False, "get_plot_configs() must return a list")
+                return (False, "get_plot_configs() must return a list", None)
         
         except Exception as e:
-            return (False, f"Instantiation failed: {e}")
+            return (False, f"Instantiation failed: {e}", None)
         
-        return (True, None)
+        return (True, None, instance)
     
     def get_available_plugins(self) -> List[str]:
         """
@@ -277,14 +405,15 @@ class PluginManager:
         """
         return self.plugin_metadata.get(plugin_name)
     
-    def get_all_plugins_metadata(self) -> Dict[str, Dict]:
+    def get_all_plugins_metadata(self) -> Mapping[str, Dict]:
         """
         Get metadata for all loaded plugins.
         
         Returns:
-            Dict[str, Dict]: Dictionary of plugin metadata
+            Mapping[str, Dict]: Read-only live view of the plugin metadata;
+                use dict() on it for a snapshot
         """
-        return self.plugin_metadata.copy()
+        return MappingProxyType(self.plugin_metadata)
     
     def get_plugin_count(self) -> int:
         """
@@ -322,7 +451,7 @@ class PluginManager:
         
         return {
             'name': plugin_name,
-            'module': self._plugin_module_map.get(plugin_name),
+            'module': self._plugin_module(plugin_name),
             'class': self.loaded_plugins[plugin_name].__name__,
             'metadata': self.plugin_metadata.get(plugin_name),
             'instance': self.plugin_instances.get(plugin_name)
@@ -0,0 +1,105 @@
+"""
+Unit tests for InteractiveChartEngine module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sqlite3
+import tempfile
+import os
+
+from src.data_manager import DataManager
+from src.chart_engine import InteractiveChartEngine
+
+
+@pytest.fixture(scope="module")
+def temp_db():
+    """
+    Create a temporary database with a 2000-bar and a 3000-bar ticker.
+    
+    Shared by the whole module: the tests only read from it.
+    """
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE ohlc_data (
+            ticker TEXT NOT NULL,
+            date DATE NOT NULL,
+            open REAL NOT NULL,
+            high REAL NOT NULL,
+            low REAL NOT NULL,
+            close REAL NOT NULL,
+            volume INTEGER,
+            PRIMARY KEY (ticker, date)
+        )
+    """)
+    
+    for ticker, n in (('MID', 2000), ('LONG', 3000)):
+        i = np.arange(n)
+        # Alternating up and down bars
+        close = 100.0 + np.where(i % 2 == 0, 0.5, -0.5)
+        pd.DataFrame({
+            'ticker': ticker,
+            'date': pd.date_range('2010-01-01', periods=n).strftime('%Y-%m-%d'),
+            'open': 100.0,
+            'high': 101.0,
+            'low': 99.0,
+            'close': close,
+            'volume': 1000000
+        }).to_sql('ohlc_data', conn, if_exists='append', index=False)
+    
+    conn.commit()
+    conn.close()
+    
+    yield db_path
+    
+    os.unlink(db_path)
+
+
+@pytest.fixture
+def engine(temp_db):
+    """Create a chart engine at the app's default width."""
+    return InteractiveChartEngine(DataManager(temp_db), width=1200)
+
+
+class TestWebGLSwitch:
+    """Test the switch between SVG and WebGL price traces."""
+    
+    def test_long_undecimated_series_uses_webgl(self, engine):
+        """Test that a series above the threshold that is not decimated uses WebGL."""
+        # 2000 rows stay below 2 x 1200 px, so every row is plotted
+        fig = engine.create_candlestick_chart('MID', show_volume=False)
+        
+        types = {trace.type for trace in fig.data}
+        assert types == {'scattergl'}
+    
+    def test_decimated_series_uses_svg_candles(self, engine):
+        """Test that a series decimated below the threshold keeps SVG candles."""
+        # 3000 rows exceed 2 x 1200 px and are bucketed down to 600
+        fig = engine.create_candlestick_chart('LONG', show_volume=False)
+        
+        assert [trace.type for trace in fig.data] == ['candlestick']
+        assert len(fig.data[0].x) == 600
+
+
+
+class TestChartSize:
+    """Test per-call chart dimensions."""
+    
+    def test_size_arguments_leave_engine_unchanged(self, engine):
+        """Test that width and height apply to one figure only."""
+        fig = engine.create_candlestick_chart(
+            'LONG', show_volume=False, width=800, height=500
+        )
+        
+        assert (fig.layout.width, fig.layout.height) == (800, 500)
+        # Decimated to half the requested width, not the engine's
+        assert len(fig.data[0].x) == 400
+        assert (engine.width, engine.height) == (1200, 600)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
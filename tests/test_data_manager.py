@@ -2,20 +2,25 @@
 Unit tests for DataManager module
 """
 
+import operator
 import pytest
 import pandas as pd
+import numpy as np
 import sqlite3
-from datetime import datetime, timedelta
-from pathlib import Path
+from datetime import datetime
 import tempfile
 import os
 
 from src.data_manager import DataManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_db():
-    """Create a temporary database for testing."""
+    """
+    Create a temporary database for testing.
+    
+    Shared by the whole module: the tests only read from it.
+    """
     # Create temporary database
     fd, db_path = tempfile.mkstemp(suffix='.db')
     os.close(fd)
@@ -25,7 +30,7 @@ def temp_db():
     cursor = conn.cursor()
     
     cursor.execute("""
-        CREATE TABLE market_data (
+        CREATE TABLE ohlc_data (
             id INTEGER PRIMARY KEY,
             ticker TEXT NOT NULL,
             date DATE NOT NULL,
@@ -38,23 +43,20 @@ def temp_db():
         )
     """)
     
-    # Insert sample data
-    base_date = datetime(2023, 1, 1)
-    for i in range(100):
-        date = (base_date + timedelta(days=i)).date()
-        cursor.execute("""
-            INSERT INTO market_data 
-            (ticker, date, open, high, low, close, volume)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            'AAPL',
-            date,
-            100.0 + i * 0.1,
-            101.0 + i * 0.1,
-            99.0 + i * 0.1,
-            100.5 + i * 0.1,
-            1000000
-        ))
+    # Insert sample data in one batch; durability is irrelevant for a
+    # throwaway database
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    i = np.arange(100)
+    pd.DataFrame({
+        'ticker': 'AAPL',
+        'date': pd.date_range('2023-01-01', periods=100).strftime('%Y-%m-%d'),
+        'open': 100.0 + i * 0.1,
+        'high': 101.0 + i * 0.1,
+        'low': 99.0 + i * 0.1,
+        'close': 100.5 + i * 0.1,
+        'volume': 1000000
+    }).to_sql('ohlc_data', conn, if_exists='append', index=False, method='multi')
     
     conn.commit()
     conn.close()
@@ -65,6 +67,12 @@ def temp_db():
     os.unlink(db_path)
 
 
+@pytest.fixture(scope="module")
+def aapl_df(temp_db):
+    """Read the sample AAPL data once per test module."""
+    return DataManager(temp_db).get_ohlcv_data('AAPL')
+
+
 class TestDataManager:
     """Test DataManager class."""
     
@@ -88,15 +96,12 @@ class TestDataManager:
         assert 'AAPL' in tickers
         assert len(tickers) >= 1
     
-    def test_get_ohlcv_data(self, temp_db):
+    def test_get_ohlcv_data(self, aapl_df):
         """Test retrieving OHLCV data."""
-        dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
-        
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 100
-        assert all(col in df.columns for col in ['open', 'high', 'low', 'close', 'volume'])
-        assert df.index.name == 'date'
+        assert isinstance(aapl_df, pd.DataFrame)
+        assert len(aapl_df) == 100
+        assert all(col in aapl_df.columns for col in ['open', 'high', 'low', 'close', 'volume'])
+        assert aapl_df.index.name == 'date'
     
     def test_get_ohlcv_data_invalid_ticker(self, temp_db):
         """Test retrieving OHLCV data for invalid ticker."""
@@ -105,40 +110,27 @@ class TestDataManager:
         with pytest.raises(ValueError):
             dm.get_ohlcv_data('INVALID')
     
-    def test_aggregate_ohlcv_daily(self, temp_db):
-        """Test daily aggregation (should return unchanged)."""
+    @pytest.mark.parametrize("timeframe, compare", [
+        ('daily', operator.eq),
+        ('weekly', operator.lt),
+        ('monthly', operator.le)
+    ])
+    def test_aggregate_ohlcv(self, temp_db, aapl_df, timeframe, compare):
+        """Test aggregation to each timeframe (daily returns unchanged)."""
         dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
-        df_agg = dm.aggregate_ohlcv(df, 'daily')
+        df_agg = dm.aggregate_ohlcv(aapl_df, timeframe)
         
-        assert len(df_agg) == len(df)
-        assert df_agg.equals(df)
-    
-    def test_aggregate_ohlcv_weekly(self, temp_db):
-        """Test weekly aggregation."""
-        dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
-        df_agg = dm.aggregate_ohlcv(df, 'weekly')
-        
-        assert len(df_agg) < len(df)
+        assert compare(len(df_agg), len(aapl_df))
         assert all(col in df_agg.columns for col in ['open', 'high', 'low', 'close', 'volume'])
+        if timeframe == 'daily':
+            assert df_agg.equals(aapl_df)
     
-    def test_aggregate_ohlcv_monthly(self, temp_db):
-        """Test monthly aggregation."""
-        dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
-        df_agg = dm.aggregate_ohlcv(df, 'monthly')
-        
-        assert len(df_agg) <= len(df)
-        assert all(col in df_agg.columns for col in ['open', 'high', 'low', 'close', 'volume'])
-    
-    def test_aggregate_ohlcv_invalid_timeframe(self, temp_db):
+    def test_aggregate_ohlcv_invalid_timeframe(self, temp_db, aapl_df):
         """Test aggregation with invalid timeframe."""
         dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
         
         with pytest.raises(ValueError):
-            dm.aggregate_ohlcv(df, 'invalid')
+            dm.aggregate_ohlcv(aapl_df, 'invalid')
     
     def test_get_date_range(self, temp_db):
         """Test getting date range."""
@@ -163,12 +155,41 @@ class TestDataManager:
         assert 'lowest_price' in info
         assert 'average_volume' in info
     
-    def test_validate_data_valid(self, temp_db):
+    def test_get_ticker_info_null_values(self, tmp_path):
+        """Test that NULL prices and volumes are reported as NaN."""
+        db_path = str(tmp_path / 'nulls.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE ohlc_data (
+                ticker TEXT NOT NULL,
+                date TEXT NOT NULL,
+                open REAL,
+                high REAL,
+                low REAL,
+                close REAL,
+                volume INTEGER,
+                PRIMARY KEY (ticker, date)
+            )
+        """)
+        conn.execute(
+            "INSERT INTO ohlc_data (ticker, date) VALUES ('NUL', '2023-01-02')"
+        )
+        conn.commit()
+        conn.close()
+        
+        info = DataManager(db_path).get_ticker_info('NUL')
+        
+        assert info['record_count'] == 1
+        assert np.isnan(info['current_price'])
+        assert np.isnan(info['highest_price'])
+        assert np.isnan(info['lowest_price'])
+        assert np.isnan(info['average_volume'])
+    
+    def test_validate_data_valid(self, temp_db, aapl_df):
         """Test data validation with valid data."""
         dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
         
-        is_valid, errors = dm.validate_data(df)
+        is_valid, errors = dm.validate_data(aapl_df)
         assert is_valid
         assert errors == []
     
@@ -217,33 +238,27 @@ class TestDataManager:
 class TestDataAggregation:
     """Test data aggregation functionality."""
     
-    def test_aggregation_preserves_ohlc_properties(self, temp_db):
+    def test_aggregation_preserves_ohlc_properties(self, temp_db, aapl_df):
         """Test that aggregation maintains OHLC properties."""
         dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
-        df_weekly = dm.aggregate_ohlcv(df, 'weekly')
+        df_weekly = dm.aggregate_ohlcv(aapl_df, 'weekly')
         
-        # High should be >= Low
-        assert (df_weekly['high'] >= df_weekly['low']).all()
+        o, h, l, c = (df_weekly[k].to_numpy() for k in ('open', 'high', 'low', 'close'))
         
-        # Open and Close should be within High and Low
-        assert (df_weekly['open'] <= df_weekly['high']).all()
-        assert (df_weekly['open'] >= df_weekly['low']).all()
-        assert (df_weekly['close'] <= df_weekly['high']).all()
-        assert (df_weekly['close'] >= df_weekly['low']).all()
+        # High should be >= Low, Open and Close within High and Low
+        assert np.all((h >= l) & (o <= h) & (o >= l) & (c <= h) & (c >= l))
     
-    def test_aggregation_volume_sums(self, temp_db):
+    def test_aggregation_volume_sums(self, temp_db, aapl_df):
         """Test that volume is summed in aggregation."""
         dm = DataManager(temp_db)
-        df = dm.get_ohlcv_data('AAPL')
         
-        df_weekly = dm.aggregate_ohlcv(df, 'weekly')
+        df_weekly = dm.aggregate_ohlcv(aapl_df, 'weekly')
         
         # Volume should be positive
         assert (df_weekly['volume'] > 0).all()
         
         # Weekly volume should be >= daily volume
-        assert (df_weekly['volume'] >= df['volume'].min()).all()
+        assert (df_weekly['volume'] >= aapl_df['volume'].min()).all()
 
 
 if __name__ == "__main__":
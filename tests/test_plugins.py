@@ -2,18 +2,32 @@
 Unit tests for Plugin System
 """
 
+import functools
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from pathlib import Path
-import tempfile
-import sys
 
 from plugins.base_indicator import BaseIndicator, ParameterDefinition, PlotConfig
+from plugins.batch import compute_all, ohlcv_arrays
+from plugins.kernels import sma_cumsum
+from plugins.streaming import StreamingSMA
+from plugins.indicators.simple_moving_average import SimpleMovingAverage
 from src.plugin_manager import PluginManager
 
 
+# Plot configs do not depend on the parameters, so they are built once
+_TEST_PLOT_CONFIGS = (
+    PlotConfig(
+        name="Test(20)",
+        type="line",
+        yaxis="y",
+        color="blue",
+        line_width=2
+    ),
+)
+
+
 # Sample test indicator
 class TestIndicator(BaseIndicator):
     """Sample indicator for testing."""
@@ -50,166 +64,134 @@ class TestIndicator(BaseIndicator):
         if not is_valid:
             raise ValueError(f"Data validation failed: {errors}")
         
-        df_copy = df.copy()
+        return self._calculate_unchecked(df)
+    
+    def _calculate_unchecked(self, df):
         period = self.parameters['period'].default
-        df_copy['TEST_VALUE'] = df_copy['close'].rolling(window=period).mean()
-        
-        return df_copy
+        return df.assign(TEST_VALUE=sma_cumsum(df['close'].to_numpy(dtype=np.float64), period))
     
     def get_plot_configs(self):
-        return [
-            PlotConfig(
-                name="Test(20)",
-                type="line",
-                yaxis="y",
-                color="blue",
-                line_width=2
-            )
-        ]
+        return list(_TEST_PLOT_CONFIGS)
 
 
-@pytest.fixture
+# Indicator without a name, which BaseIndicator must reject
+class InvalidIndicator(BaseIndicator):
+    version = "1.0.0"
+    author = "Test"
+    
+    def _define_parameters(self):
+        return {}
+    
+    def calculate(self, df):
+        return df
+    
+    def get_plot_configs(self):
+        return []
+
+
+@pytest.fixture(scope="session")
 def sample_ohlcv_data():
-    """Create sample OHLCV data."""
-    dates = pd.date_range('2023-01-01', periods=100)
-    return pd.DataFrame({
-        'open': np.random.uniform(100, 110, 100),
-        'high': np.random.uniform(110, 120, 100),
-        'low': np.random.uniform(90, 100, 100),
-        'close': np.random.uniform(100, 110, 100),
-        'volume': np.random.randint(1000000, 10000000, 100)
-    }, index=dates)
+    """Create sample OHLCV data, shared by all tests (seeded, never mutated)."""
+    rng = np.random.default_rng(0)
+    # Just above the 20-bar windows of the indicators under test
+    n = 25
+    dates = pd.date_range('2023-01-01', periods=n)
+    # open, high, low, close drawn in one call with per-column bounds
+    prices = rng.uniform([100, 110, 90, 100], [110, 120, 100, 110], size=(n, 4))
+    df = pd.DataFrame(prices, index=dates, columns=['open', 'high', 'low', 'close'])
+    df['volume'] = rng.integers(1000000, 10000000, n, dtype=np.int32)
+    return df
+
+
+@pytest.fixture(scope="session")
+def indicator():
+    """Create a TestIndicator shared by the tests that do not change it."""
+    return TestIndicator()
+
+
+@functools.cache
+def _make_param(**kwargs):
+    """Build each distinct ParameterDefinition once (choices as a tuple)."""
+    return ParameterDefinition(**kwargs)
+
+
+@pytest.fixture
+def stub_pm():
+    """Build PluginManagers with the given plugin classes, skipping discovery."""
+    def make(loaded_plugins=None):
+        pm = PluginManager.__new__(PluginManager)
+        pm.loaded_plugins = loaded_plugins or {}
+        # Mirror load_plugin, which stores one instance per loaded class
+        pm.plugin_instances = {name: cls() for name, cls in pm.loaded_plugins.items()}
+        pm.plugin_metadata = {}
+        return pm
+    return make
 
 
 class TestParameterDefinition:
     """Test ParameterDefinition class."""
     
-    def test_int_parameter_valid(self):
-        """Test valid integer parameter."""
-        param = ParameterDefinition(
-            name="period",
-            type="int",
-            default=20,
-            min_value=2,
-            max_value=500,
-            step=1
-        )
-        
-        is_valid, error = param.validate(20)
-        assert is_valid
-        assert error is None
-    
-    def test_int_parameter_invalid_type(self):
-        """Test invalid integer parameter type."""
-        param = ParameterDefinition(
-            name="period",
-            type="int",
-            default=20
-        )
-        
-        is_valid, error = param.validate("20")
-        assert not is_valid
-        assert "Expected int" in error
-    
-    def test_int_parameter_out_of_range(self):
-        """Test integer parameter out of range."""
-        param = ParameterDefinition(
-            name="period",
-            type="int",
-            default=20,
-            min_value=2,
-            max_value=100
-        )
-        
-        is_valid, error = param.validate(150)
-        assert not is_valid
-        assert "above maximum" in error
-    
-    def test_float_parameter_valid(self):
-        """Test valid float parameter."""
-        param = ParameterDefinition(
-            name="threshold",
-            type="float",
-            default=50.0,
-            min_value=0.0,
-            max_value=100.0
-        )
-        
-        is_valid, error = param.validate(50.0)
-        assert is_valid
-    
-    def test_bool_parameter_valid(self):
-        """Test valid boolean parameter."""
-        param = ParameterDefinition(
-            name="show_signal",
-            type="bool",
-            default=True
-        )
-        
-        is_valid, error = param.validate(True)
-        assert is_valid
-    
-    def test_choice_parameter_valid(self):
-        """Test valid choice parameter."""
-        param = ParameterDefinition(
-            name="ma_type",
-            type="choice",
-            default="sma",
-            choices=["sma", "ema", "dema"]
-        )
-        
-        is_valid, error = param.validate("ema")
-        assert is_valid
-    
-    def test_choice_parameter_invalid(self):
-        """Test invalid choice parameter."""
-        param = ParameterDefinition(
-            name="ma_type",
-            type="choice",
-            default="sma",
-            choices=["sma", "ema", "dema"]
+    @pytest.mark.parametrize("kwargs, value, expect_valid, error_substr", [
+        pytest.param(
+            dict(name="period", type="int", default=20, min_value=2, max_value=500, step=1),
+            20, True, None, id="int_valid"
+        ),
+        pytest.param(
+            dict(name="period", type="int", default=20),
+            "20", False, "Expected int", id="int_invalid_type"
+        ),
+        pytest.param(
+            dict(name="period", type="int", default=20, min_value=2, max_value=100),
+            150, False, "above maximum", id="int_out_of_range"
+        ),
+        pytest.param(
+            dict(name="threshold", type="float", default=50.0, min_value=0.0, max_value=100.0),
+            50.0, True, None, id="float_valid"
+        ),
+        pytest.param(
+            dict(name="show_signal", type="bool", default=True),
+            True, True, None, id="bool_valid"
+        ),
+        pytest.param(
+            dict(name="ma_type", type="choice", default="sma", choices=("sma", "ema", "dema")),
+            "ema", True, None, id="choice_valid"
+        ),
+        pytest.param(
+            dict(name="ma_type", type="choice", default="sma", choices=("sma", "ema", "dema")),
+            "invalid", False, "", id="choice_invalid"
         )
+    ])
+    def test_validate(self, kwargs, value, expect_valid, error_substr):
+        """Test parameter validation for each parameter type."""
+        param = _make_param(**kwargs)
         
-        is_valid, error = param.validate("invalid")
-        assert not is_valid
+        is_valid, error = param.validate(value)
+        assert is_valid == expect_valid
+        if expect_valid:
+            assert error is None
+        else:
+            assert error_substr in error
 
 
 class TestPlotConfig:
     """Test PlotConfig class."""
     
-    def test_valid_plot_config(self):
-        """Test valid plot configuration."""
-        config = PlotConfig(
-            name="Test",
-            type="line",
-            yaxis="y",
-            color="blue",
-            line_width=2
-        )
-        
-        is_valid, error = config.validate()
-        assert is_valid
-        assert error is None
-    
-    def test_invalid_plot_type(self):
-        """Test invalid plot type."""
-        config = PlotConfig(
-            name="Test",
-            type="invalid"
-        )
+    @pytest.mark.parametrize("kwargs, expect_valid", [
+        pytest.param(
+            dict(name="Test", type="line", yaxis="y", color="blue", line_width=2),
+            True, id="valid"
+        ),
+        pytest.param(dict(name="Test", type="invalid"), False, id="invalid_type"),
+        pytest.param(dict(name="Test", opacity=1.5), False, id="invalid_opacity")
+    ])
+    def test_validate(self, kwargs, expect_valid):
+        """Test plot configuration validation."""
+        config = PlotConfig(**kwargs)
         
         is_valid, error = config.validate()
-        assert not is_valid
-    
-    def test_invalid_opacity(self):
-        """Test invalid opacity value."""
-        config = PlotConfig(
-            name="Test",
-            opacity=1.5
-        )
-        
-        is_valid, error = config.validate()
-        assert not is_valid
+        assert is_valid == expect_valid
+        if expect_valid:
+            assert error is None
 
 
 class TestBaseIndicator:
@@ -227,49 +209,32 @@ class TestBaseIndicator:
     
     def test_indicator_missing_name(self):
         """Test that indicator requires name."""
-        class InvalidIndicator(BaseIndicator):
-            version = "1.0.0"
-            author = "Test"
-            
-            def _define_parameters(self):
-                return {}
-            
-            def calculate(self, df):
-                return df
-            
-            def get_plot_configs(self):
-                return []
-        
         with pytest.raises(ValueError):
             InvalidIndicator()
     
-    def test_validate_data_valid(self, sample_ohlcv_data):
+    def test_validate_data_valid(self, indicator, sample_ohlcv_data):
         """Test data validation with valid data."""
-        indicator = TestIndicator()
         is_valid, errors = indicator.validate_data(sample_ohlcv_data)
         
         assert is_valid
         assert errors == []
     
-    def test_validate_data_missing_columns(self):
+    def test_validate_data_missing_columns(self, indicator):
         """Test data validation with missing columns."""
-        indicator = TestIndicator()
         df = pd.DataFrame({'open': [100], 'close': [101]})
         
         is_valid, errors = indicator.validate_data(df)
         assert not is_valid
     
-    def test_validate_parameters_valid(self):
+    def test_validate_parameters_valid(self, indicator):
         """Test parameter validation with valid params."""
-        indicator = TestIndicator()
         is_valid, errors = indicator.validate_parameters({'period': 30})
         
         assert is_valid
         assert errors == []
     
-    def test_validate_parameters_invalid(self):
+    def test_validate_parameters_invalid(self, indicator):
         """Test parameter validation with invalid params."""
-        indicator = TestIndicator()
         is_valid, errors = indicator.validate_parameters({'period': -5})
         
         assert not is_valid
@@ -283,35 +248,54 @@ class TestBaseIndicator:
         assert is_valid
         assert indicator.parameters['period'].default == 40
     
-    def test_get_parameters(self):
+    def test_get_parameters(self, indicator):
         """Test getting parameters."""
-        indicator = TestIndicator()
         params = indicator.get_parameters()
         
         assert params['period'] == 20
         assert params['threshold'] == 50.0
     
-    def test_indicator_calculation(self, sample_ohlcv_data):
+    def test_assigned_default_drives_calculation(self, sample_ohlcv_data):
+        """Test that a default assigned directly is used for the output."""
+        sma = SimpleMovingAverage()
+        sma.parameters['period'].default = 5
+        
+        result = sma.calculate(sample_ohlcv_data)
+        
+        assert sma.get_parameters() == {'period': 5}
+        assert 'SMA_5' in result.columns
+        assert sma.get_plot_configs()[0].name == 'SMA(5)'
+        expected = sample_ohlcv_data['close'].rolling(5).mean()
+        np.testing.assert_allclose(result['SMA_5'], expected)
+    
+    def test_indicator_calculation(self, indicator, sample_ohlcv_data):
         """Test indicator calculation."""
-        indicator = TestIndicator()
         df_result = indicator.calculate(sample_ohlcv_data)
         
         assert len(df_result) == len(sample_ohlcv_data)
         assert 'TEST_VALUE' in df_result.columns
         assert df_result['TEST_VALUE'].notna().sum() > 0
     
-    def test_get_plot_configs(self):
+    def test_compute_all_matches_calculate(self, indicator, sample_ohlcv_data):
+        """Test batched calculation, including the calculate() fallback."""
+        indicators = [SimpleMovingAverage(), indicator]
+        df_result = compute_all(sample_ohlcv_data, indicators)
+        
+        expected = indicator._calculate_unchecked(
+            SimpleMovingAverage().calculate(sample_ohlcv_data)
+        )
+        pd.testing.assert_frame_equal(df_result, expected)
+    
+    def test_get_plot_configs(self, indicator):
         """Test getting plot configurations."""
-        indicator = TestIndicator()
         configs = indicator.get_plot_configs()
         
         assert isinstance(configs, list)
         assert len(configs) > 0
-        assert all(isinstance(c, PlotConfig) for c in configs)
+        assert all(type(c) is PlotConfig for c in configs)
     
-    def test_get_metadata(self):
+    def test_get_metadata(self, indicator):
         """Test getting indicator metadata."""
-        indicator = TestIndicator()
         metadata = indicator.get_metadata()
         
         assert metadata['name'] == "Test Indicator"
@@ -321,72 +305,128 @@ class TestBaseIndicator:
         assert 'outputs' in metadata
 
 
+class TestStreaming:
+    """Test streaming indicator variants."""
+    
+    def test_streaming_sma_matches_batch(self, sample_ohlcv_data):
+        """Test that per-bar updates reproduce the batch SMA."""
+        expected = SimpleMovingAverage().calculate_arrays(
+            *ohlcv_arrays(sample_ohlcv_data)
+        )['SMA_20']
+        
+        sma = StreamingSMA(period=20)
+        values = [
+            sma.update(*bar)['SMA_20']
+            for bar in zip(*ohlcv_arrays(sample_ohlcv_data))
+        ]
+        
+        np.testing.assert_allclose(values, expected, equal_nan=True)
+
+
 class TestPluginManager:
     """Test PluginManager class."""
     
-    def test_plugin_manager_initialization(self):
+    def test_plugin_manager_initialization(self, tmp_path):
         """Test PluginManager initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            indicators_dir = Path(tmpdir) / "indicators"
-            indicators_dir.mkdir()
-            
-            pm = PluginManager(str(indicators_dir))
-            assert pm.plugins_dir == indicators_dir
-            assert pm.loaded_plugins == {}
+        indicators_dir = tmp_path / "indicators"
+        indicators_dir.mkdir()
+        
+        pm = PluginManager(str(indicators_dir))
+        assert pm.plugins_dir == indicators_dir
+        assert pm.loaded_plugins == {}
     
     def test_plugin_manager_missing_directory(self):
         """Test PluginManager with missing directory."""
         with pytest.raises(FileNotFoundError):
             PluginManager("/nonexistent/path")
     
-    def test_discover_plugins(self):
+    def test_discover_plugins(self, tmp_path):
         """Test plugin discovery."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            indicators_dir = Path(tmpdir) / "indicators"
-            indicators_dir.mkdir()
-            
-            # Create dummy plugin files
-            (indicators_dir / "test_plugin1.py").touch()
-            (indicators_dir / "test_plugin2.py").touch()
-            (indicators_dir / "__init__.py").touch()
-            
-            pm = PluginManager(str(indicators_dir))
-            plugins = pm.discover_plugins()
-            
-            assert 'test_plugin1' in plugins
-            assert 'test_plugin2' in plugins
-            assert '__init__' not in plugins
-    
-    def test_get_available_plugins(self):
+        # Create dummy plugin files
+        (tmp_path / "test_plugin1.py").touch()
+        (tmp_path / "test_plugin2.py").touch()
+        (tmp_path / "__init__.py").touch()
+        
+        pm = PluginManager(str(tmp_path))
+        plugins = pm.discover_plugins()
+        
+        assert 'test_plugin1' in plugins
+        assert 'test_plugin2' in plugins
+        assert '__init__' not in plugins
+    
+    def test_reload_plugins_skips_unchanged_modules(self, tmp_path):
+        """Test that reloading only re-executes changed plugin files."""
+        source = Path(__file__).parent.parent / "plugins" / "indicators" / "simple_moving_average.py"
+        
+        plugin_file = tmp_path / "sma_copy.py"
+        plugin_file.write_text(source.read_text())
+        
+        pm = PluginManager(str(tmp_path))
+        pm.load_all_plugins()
+        instance = pm.get_plugin("Simple Moving Average")
+        
+        # Unchanged file: the loaded instance is kept
+        pm.reload_plugins()
+        assert pm.get_plugin("Simple Moving Average") is instance
+        
+        # Changed file: the module is executed again
+        plugin_file.write_text(source.read_text() + "\n# edited\n")
+        pm.reload_plugins()
+        assert pm.get_plugin("Simple Moving Average") is not instance
+        
+        # Removed file: its plugins are dropped
+        plugin_file.unlink()
+        pm.reload_plugins()
+        assert pm.get_plugin("Simple Moving Average") is None
+    
+    def test_load_plugin_skips_modules_without_classes(self, tmp_path):
+        """Test that modules without any class are not executed."""
+        (tmp_path / "helpers.py").write_text(
+            "raise RuntimeError('executed')\n\ndef helper():\n    pass\n"
+        )
+        
+        pm = PluginManager(str(tmp_path))
+        success, error = pm.load_plugin("helpers")
+        
+        assert not success
+        assert "No valid BaseIndicator subclasses" in error
+    
+    def test_load_plugin_runs_modules_with_indirect_subclasses(self, tmp_path):
+        """Test that subclasses of imported or aliased indicators still load."""
+        (tmp_path / "fast_sma.py").write_text(
+            "from plugins.indicators.simple_moving_average import SimpleMovingAverage\n"
+            "\n"
+            "Base = SimpleMovingAverage\n"
+            "\n"
+            "class FastSMA(Base):\n"
+            "    name = 'Fast SMA'\n"
+        )
+        
+        pm = PluginManager(str(tmp_path))
+        assert pm.load_plugin("fast_sma") == (True, None)
+        assert pm.is_plugin_loaded("Fast SMA")
+    
+    def test_get_available_plugins(self, stub_pm):
         """Test getting available plugins."""
-        pm = PluginManager.__new__(PluginManager)
-        pm.loaded_plugins = {
+        pm = stub_pm({
             'Test Indicator': TestIndicator,
             'Another Indicator': TestIndicator
-        }
-        pm.plugin_instances = {}
-        pm.plugin_metadata = {}
+        })
         
         plugins = pm.get_available_plugins()
         assert 'Test Indicator' in plugins
         assert 'Another Indicator' in plugins
     
-    def test_get_plugin(self):
+    def test_get_plugin(self, stub_pm):
         """Test getting a plugin instance."""
-        pm = PluginManager.__new__(PluginManager)
-        pm.loaded_plugins = {'Test Indicator': TestIndicator}
-        pm.plugin_instances = {}
-        pm.plugin_metadata = {}
+        pm = stub_pm({'Test Indicator': TestIndicator})
         
         plugin = pm.get_plugin('Test Indicator')
         assert isinstance(plugin, TestIndicator)
     
-    def test_get_plugin_not_found(self):
+    def test_get_plugin_not_found(self, stub_pm):
         """Test getting non-existent plugin."""
-        pm = PluginManager.__new__(PluginManager)
-        pm.loaded_plugins = {}
-        pm.plugin_instances = {}
-        pm.plugin_metadata = {}
+        pm = stub_pm()
         
         plugin = pm.get_plugin('Nonexistent')
         assert plugin is None